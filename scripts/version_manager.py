@@ -4,35 +4,62 @@ Version management script for Classic Models API.
 Similar to 'npm version' - handles git tagging, config updates, and Docker builds.
 """
 
-import argparse
 import re
-import subprocess
+import shutil
 import sys
 from pathlib import Path
 
+# argparse and subprocess are imported where they are used so that importing
+# VersionManager (e.g. from tests) does not pay for them up front.
+
+SETTINGS_VERSION_RE = re.compile(r'"VERSION":\s*"([^"]*)"')
+API_VERSION_RE = re.compile(r'(return os\.environ\.get\("API_VERSION",\s*")[^"]*("\))')
+
 
 class VersionManager:
     def __init__(self):
         self.project_root = Path(__file__).parent.parent
         self.settings_file = self.project_root / "config" / "settings" / "base.py"
+        self._settings_cache = None
+        # Resolve git once; an absolute path also skips the PATH search per call
+        self._git = shutil.which("git") or "git"
+
+    def _read_settings(self):
+        """Return the settings file content, reading it at most once."""
+        if self._settings_cache is None:
+            self._settings_cache = self.settings_file.read_text()
+        return self._settings_cache
+
+    def _run_git(self, *args, check=True, **kwargs):
+        """Run a git command against the project root."""
+        import subprocess
+
+        # Use "git -C" instead of cwd= and keep close_fds off so subprocess
+        # can take its posix_spawn fast path rather than fork() + exec().
+        return subprocess.run(
+            [self._git, "-C", str(self.project_root), *args],
+            check=check,
+            close_fds=False,
+            **kwargs,
+        )
+
+    def _git_succeeds(self, *args):
+        """Run a git probe and report whether it exited successfully."""
+        return self._run_git(*args, check=False, capture_output=True).returncode == 0
 
     def get_current_version(self):
         """Get current version from git tag or settings."""
+        import subprocess
+
         try:
             # Get all tags and find the latest semver version
-            result = subprocess.run(
-                ["git", "tag", "-l", "v*"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.project_root,
-            )
+            result = self._run_git("tag", "-l", "v*", capture_output=True, text=True)
             tags = result.stdout.strip().split("\n")
             if tags and tags[0]:  # Check if we have any tags
-                # Sort tags by semver and get the latest
-                latest_tag = sorted(
-                    tags, key=lambda x: [int(v) for v in x.lstrip("v").split(".")]
-                )[-1]
+                # Pick the highest semver tag (tags are already filtered to v*)
+                latest_tag = max(
+                    tags, key=lambda t: tuple(int(v) for v in t[1:].split("."))
+                )
                 return latest_tag.lstrip("v")
             else:
                 # No tags found, fall back to settings
@@ -46,8 +73,8 @@ class VersionManager:
         if not self.settings_file.exists():
             return "0.0.0"
 
-        content = self.settings_file.read_text()
-        match = re.search(r'"VERSION":\s*"([^"]*)"', content)
+        content = self._read_settings()
+        match = SETTINGS_VERSION_RE.search(content)
         return match.group(1) if match else "0.0.0"
 
     def _update_settings_version(self, version):
@@ -56,15 +83,15 @@ class VersionManager:
             print(f"Settings file not found: {self.settings_file}")
             return False
 
-        content = self.settings_file.read_text()
+        content = self._read_settings()
 
         # Update get_version() function default value
-        pattern = r'(return os\.environ\.get\("API_VERSION",\s*")[^"]*("\))'
         replacement = rf"\g<1>{version}\g<2>"
-        updated_content = re.sub(pattern, replacement, content)
+        updated_content = API_VERSION_RE.sub(replacement, content)
 
         if updated_content != content:
             self.settings_file.write_text(updated_content)
+            self._settings_cache = updated_content
             print(f"Updated API version to: {version}")
             return True
         else:
@@ -106,24 +133,11 @@ class VersionManager:
     def _validate_git_status(self):
         """Validate git repository status."""
         # Check if we're in a git repository
-        try:
-            subprocess.run(
-                ["git", "status"],
-                capture_output=True,
-                check=True,
-                cwd=self.project_root,
-            )
-        except subprocess.CalledProcessError:
+        if not self._git_succeeds("status"):
             raise RuntimeError("Not in a git repository")
 
         # Check for uncommitted changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=self.project_root,
-        )
+        result = self._run_git("status", "--porcelain", capture_output=True, text=True)
 
         if result.stdout.strip():
             print("Warning: You have uncommitted changes:")
@@ -134,85 +148,48 @@ class VersionManager:
 
     def _check_main_branch_up_to_date(self):
         """Check if main branch is up to date with origin/main before tagging."""
+        import subprocess
+
         print("Checking if main branch is up to date...")
 
         # Fetch latest from remote
-        try:
-            subprocess.run(
-                ["git", "fetch", "origin"],
-                capture_output=True,
-                check=True,
-                cwd=self.project_root,
-            )
-        except subprocess.CalledProcessError:
+        if not self._git_succeeds("fetch", "origin"):
             print("Warning: Could not fetch from origin. Continuing anyway...")
             return
 
-        # Check if main branch exists locally
-        try:
-            subprocess.run(
-                ["git", "rev-parse", "--verify", "main"],
-                capture_output=True,
-                check=True,
-                cwd=self.project_root,
-            )
-        except subprocess.CalledProcessError:
-            # Try 'master' as fallback
-            try:
-                subprocess.run(
-                    ["git", "rev-parse", "--verify", "master"],
-                    capture_output=True,
-                    check=True,
-                    cwd=self.project_root,
-                )
-                main_branch = "master"
-            except subprocess.CalledProcessError:
-                print(
-                    "Warning: Could not find main or master branch. Skipping check..."
-                )
-                return
-        else:
+        # Check if main branch exists locally, trying 'master' as fallback
+        if self._git_succeeds("rev-parse", "--verify", "main"):
             main_branch = "main"
+        elif self._git_succeeds("rev-parse", "--verify", "master"):
+            main_branch = "master"
+        else:
+            print("Warning: Could not find main or master branch. Skipping check...")
+            return
 
         # Check if origin/main exists
-        try:
-            subprocess.run(
-                ["git", "rev-parse", "--verify", f"origin/{main_branch}"],
-                capture_output=True,
-                check=True,
-                cwd=self.project_root,
-            )
-        except subprocess.CalledProcessError:
+        if not self._git_succeeds("rev-parse", "--verify", f"origin/{main_branch}"):
             print(f"Warning: origin/{main_branch} does not exist. Skipping check...")
             return
 
         # Compare local main with origin/main
         try:
             # Get commit hashes
-            local_result = subprocess.run(
-                ["git", "rev-parse", main_branch],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.project_root,
+            local_result = self._run_git(
+                "rev-parse", main_branch, capture_output=True, text=True
             )
             local_commit = local_result.stdout.strip()
 
-            subprocess.run(
-                ["git", "rev-parse", f"origin/{main_branch}"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.project_root,
+            self._run_git(
+                "rev-parse", f"origin/{main_branch}", capture_output=True, text=True
             )
 
             # Check if local is behind remote
-            behind_result = subprocess.run(
-                ["git", "rev-list", "--count", f"{local_commit}..origin/{main_branch}"],
+            behind_result = self._run_git(
+                "rev-list",
+                "--count",
+                f"{local_commit}..origin/{main_branch}",
                 capture_output=True,
                 text=True,
-                check=True,
-                cwd=self.project_root,
             )
             behind_count = int(behind_result.stdout.strip())
 
@@ -224,12 +201,12 @@ class VersionManager:
                 )
 
             # Check if local is ahead of remote (optional, but good to know)
-            ahead_result = subprocess.run(
-                ["git", "rev-list", "--count", f"origin/{main_branch}..{local_commit}"],
+            ahead_result = self._run_git(
+                "rev-list",
+                "--count",
+                f"origin/{main_branch}..{local_commit}",
                 capture_output=True,
                 text=True,
-                check=True,
-                cwd=self.project_root,
             )
             ahead_count = int(ahead_result.stdout.strip())
 
@@ -246,16 +223,10 @@ class VersionManager:
     def _commit_version_change(self, version):
         """Commit version changes."""
         # Add the settings file
-        subprocess.run(
-            ["git", "add", str(self.settings_file)], check=True, cwd=self.project_root
-        )
+        self._run_git("add", str(self.settings_file))
 
         # Commit
-        subprocess.run(
-            ["git", "commit", "-m", f"Bump version to {version}"],
-            check=True,
-            cwd=self.project_root,
-        )
+        self._run_git("commit", "-m", f"Bump version to {version}")
         print(f"Committed version change: {version}")
 
     def _create_git_tag(self, version):
@@ -263,25 +234,19 @@ class VersionManager:
         tag_name = f"v{version}"
 
         # Check if tag already exists
-        try:
-            subprocess.run(
-                ["git", "rev-parse", tag_name],
-                capture_output=True,
-                check=True,
-                cwd=self.project_root,
-            )
+        if self._git_succeeds("rev-parse", tag_name):
             print(f"Tag {tag_name} already exists")
             return tag_name
-        except subprocess.CalledProcessError:
-            pass
 
         # Create tag
-        subprocess.run(["git", "tag", tag_name], check=True, cwd=self.project_root)
+        self._run_git("tag", tag_name)
         print(f"Created tag: {tag_name}")
         return tag_name
 
     def _build_docker_image(self, version, push=False):
         """Build Docker image."""
+        import subprocess
+
         tag_name = f"v{version}"
         image_name = f"ghcr.io/{self._get_repo_name()}:{tag_name}"
         latest_name = f"ghcr.io/{self._get_repo_name()}:latest"
@@ -306,13 +271,11 @@ class VersionManager:
 
     def _get_repo_name(self):
         """Get repository name from git remote."""
+        import subprocess
+
         try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.project_root,
+            result = self._run_git(
+                "remote", "get-url", "origin", capture_output=True, text=True
             )
             url = result.stdout.strip()
             # Extract repo name from URL (handle both https and ssh formats)
@@ -367,8 +330,8 @@ class VersionManager:
         # Push to remote
         if options.push and not options.skip_git:
             print("Pushing changes to remote...")
-            subprocess.run(["git", "push"], check=True, cwd=self.project_root)
-            subprocess.run(["git", "push", "--tags"], check=True, cwd=self.project_root)
+            self._run_git("push")
+            self._run_git("push", "--tags")
             print("Changes pushed to remote")
 
         print(f"\n✅ Version {new_version} ready!")
@@ -379,6 +342,8 @@ class VersionManager:
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Version management for Classic Models API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2,7 +2,28 @@
 Pytest configuration and shared fixtures for the Classic Models API tests.
 """
 
+import itertools
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
 import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.test import Client
+from rest_framework.test import APIClient, APIRequestFactory
+
+from classicmodels.models import (
+    Customer,
+    Employee,
+    Office,
+    Order,
+    Orderdetail,
+    Payment,
+    Product,
+    ProductLine,
+)
 
 # Configure pytest-django to allow database access by default
 pytest_plugins = ["pytest_django"]
@@ -14,21 +35,20 @@ pytest_plugins = ["pytest_django"]
 # Remove pytest_configure - we'll handle model configuration in fixtures
 
 
+@receiver(connection_created)
+def relax_sqlite_durability(sender, connection, **kwargs):
+    """Skip fsync and on-disk journals; test data never needs to survive a crash."""
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+
+
 @pytest.fixture(autouse=True, scope="session")
 def django_setup(django_db_setup, django_db_blocker):
     """Set up Django models for testing."""
     with django_db_blocker.unblock():
-        from classicmodels.models import (
-            Customer,
-            Employee,
-            Office,
-            Order,
-            Orderdetail,
-            Payment,
-            Product,
-            ProductLine,
-        )
-
         # Override models to be managed for testing
         Office._meta.managed = True
         ProductLine._meta.managed = True
@@ -39,39 +59,28 @@ def django_setup(django_db_setup, django_db_blocker):
         Orderdetail._meta.managed = True
         Payment._meta.managed = True
 
-        # Create database tables
+        # Create the now-managed tables in one schema-editor pass, unless a
+        # reused (--reuse-db) test database already has them
+        from django.core.management import call_command
         from django.db import connection
 
-        # Create tables for all models
-        with connection.schema_editor() as schema_editor:
-            for model in [
-                Office,
-                ProductLine,
-                Product,
-                Employee,
-                Customer,
-                Order,
-                Orderdetail,
-                Payment,
-            ]:
-                schema_editor.create_model(model)
+        if Office._meta.db_table not in connection.introspection.table_names():
+            call_command("migrate", run_syncdb=True, verbosity=0, interactive=False)
 
 
 @pytest.fixture(autouse=True, scope="session")
 def disable_throttling(django_setup):
     """Disable throttling for all tests by patching throttle classes."""
-    # Replace throttle classes in viewsets with empty list
-    # This affects all viewsets that inherit from BaseModelViewSet
-    # (ProductLineViewSet, ProductViewSet, OfficeViewSet, EmployeeViewSet,
-    #  CustomerViewSet, OrderViewSet)
+    # DEFAULT_THROTTLE_CLASSES is already empty in the test settings, but the
+    # views set throttle_classes explicitly (and the function-based views bake
+    # them in via @throttle_classes), so patch the views and the throttles
+    # themselves. The ExitStack undoes every patch when the session ends.
     from api.v1.classicmodels.views import (
         BaseModelViewSet,
         PaymentViewSet,
         OrderdetailViewSet,
     )
     from authentication.views import CustomTokenObtainPairView, CustomTokenRefreshView
-
-    # Also patch the throttle classes themselves to always allow requests
     from config.throttles import (
         ReadThrottle,
         WriteThrottle,
@@ -82,131 +91,140 @@ def disable_throttling(django_setup):
         CurrentUserThrottle,
     )
 
-    # Store original allow_request methods
-    ReadThrottle._original_allow_request = ReadThrottle.allow_request
-    WriteThrottle._original_allow_request = WriteThrottle.allow_request
-    LoginThrottle._original_allow_request = LoginThrottle.allow_request
-    RegisterThrottle._original_allow_request = RegisterThrottle.allow_request
-    TokenRefreshThrottle._original_allow_request = TokenRefreshThrottle.allow_request
-    LogoutThrottle._original_allow_request = LogoutThrottle.allow_request
-    CurrentUserThrottle._original_allow_request = CurrentUserThrottle.allow_request
-
-    # Create a no-op allow_request method
-    def allow_request_always_true(self, request, view):
-        return True
-
-    # Patch all throttle classes to always allow requests
-    ReadThrottle.allow_request = allow_request_always_true
-    WriteThrottle.allow_request = allow_request_always_true
-    LoginThrottle.allow_request = allow_request_always_true
-    RegisterThrottle.allow_request = allow_request_always_true
-    TokenRefreshThrottle.allow_request = allow_request_always_true
-    LogoutThrottle.allow_request = allow_request_always_true
-    CurrentUserThrottle.allow_request = allow_request_always_true
-
-    # Store original throttle classes for restoration if needed
-    BaseModelViewSet._original_throttle_classes = BaseModelViewSet.throttle_classes
-    PaymentViewSet._original_throttle_classes = PaymentViewSet.throttle_classes
-    OrderdetailViewSet._original_throttle_classes = OrderdetailViewSet.throttle_classes
-    CustomTokenObtainPairView._original_throttle_classes = (
-        CustomTokenObtainPairView.throttle_classes
+    throttles = (
+        ReadThrottle,
+        WriteThrottle,
+        LoginThrottle,
+        RegisterThrottle,
+        TokenRefreshThrottle,
+        LogoutThrottle,
+        CurrentUserThrottle,
     )
-    CustomTokenRefreshView._original_throttle_classes = getattr(
-        CustomTokenRefreshView, "throttle_classes", []
+    throttled_views = (
+        BaseModelViewSet,
+        PaymentViewSet,
+        OrderdetailViewSet,
+        CustomTokenObtainPairView,
+        CustomTokenRefreshView,
     )
 
-    # Replace with empty list to disable throttling during tests
-    # This prevents HTTP 429 errors when running many tests in sequence
-    BaseModelViewSet.throttle_classes = []
-    PaymentViewSet.throttle_classes = []
-    OrderdetailViewSet.throttle_classes = []
-    CustomTokenObtainPairView.throttle_classes = []
-    CustomTokenRefreshView.throttle_classes = []
-
-    yield
-
-    # Restore original throttle classes and methods (teardown)
-    ReadThrottle.allow_request = ReadThrottle._original_allow_request
-    WriteThrottle.allow_request = WriteThrottle._original_allow_request
-    LoginThrottle.allow_request = LoginThrottle._original_allow_request
-    RegisterThrottle.allow_request = RegisterThrottle._original_allow_request
-    TokenRefreshThrottle.allow_request = TokenRefreshThrottle._original_allow_request
-    LogoutThrottle.allow_request = LogoutThrottle._original_allow_request
-    CurrentUserThrottle.allow_request = CurrentUserThrottle._original_allow_request
-
-    BaseModelViewSet.throttle_classes = getattr(
-        BaseModelViewSet, "_original_throttle_classes", []
-    )
-    PaymentViewSet.throttle_classes = getattr(
-        PaymentViewSet, "_original_throttle_classes", []
-    )
-    OrderdetailViewSet.throttle_classes = getattr(
-        OrderdetailViewSet, "_original_throttle_classes", []
-    )
-    CustomTokenObtainPairView.throttle_classes = getattr(
-        CustomTokenObtainPairView, "_original_throttle_classes", []
-    )
-    if hasattr(CustomTokenRefreshView, "_original_throttle_classes"):
-        CustomTokenRefreshView.throttle_classes = (
-            CustomTokenRefreshView._original_throttle_classes
-        )
+    with ExitStack() as stack:
+        for throttle in throttles:
+            stack.enter_context(
+                patch.object(
+                    throttle, "allow_request", lambda self, request, view: True
+                )
+            )
+        # This prevents HTTP 429 errors when running many tests in sequence
+        for view in throttled_views:
+            stack.enter_context(patch.object(view, "throttle_classes", []))
+        yield
+
+
+@pytest.fixture
+def unpaginated(monkeypatch):
+    """Serve viewset lists as plain lists, skipping the paginator's COUNT query."""
+    # pagination_class is bound from the settings when DRF is imported, so
+    # override_settings would not reach it; patch the shared base viewset.
+    from api.v1.classicmodels.views import BaseModelViewSet
+
+    monkeypatch.setattr(BaseModelViewSet, "pagination_class", None)
+
+
+@contextmanager
+def _rolled_back_atomic(django_db_blocker):
+    """Open an atomic block that is always rolled back on exit.
+
+    The database is only unblocked to enter and leave the block, so the
+    body keeps whatever access the caller has.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+
+    try:
+        yield
+    finally:
+        with django_db_blocker.unblock():
+            transaction.set_rollback(True)
+            atomic.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="session")
+def session_transaction(django_setup, django_db_blocker):
+    """Hold session-scoped fixture data in a transaction rolled back at exit.
+
+    Tests marked ``django_db`` run inside a savepoint nested in this
+    transaction, so their writes are undone after each test while the
+    shared rows stay in place until the session ends.
+    """
+    with _rolled_back_atomic(django_db_blocker):
+        yield
 
 
 @pytest.fixture
 def api_client():
     """API client for testing endpoints."""
-    from rest_framework.test import APIClient
-
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def api_request_factory():
+    """Request factory for calling DRF views directly, without URL routing."""
+    return APIRequestFactory()
+
+
 @pytest.fixture
 def django_client():
     """Django test client for testing views."""
-    from django.test import Client
-
     return Client()
 
 
 @pytest.fixture
 def authenticated_api_client(api_client, user):
     """API client with authentication."""
-    from rest_framework_simplejwt.tokens import RefreshToken
-
-    refresh = RefreshToken.for_user(user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    # Skip the JWT round-trip; tests that check the token flow use login_tokens
+    api_client.force_authenticate(user=user)
     return api_client
 
 
-@pytest.fixture
-def user():
-    """Create a test user."""
-    from django.contrib.auth.models import User
-
-    return User.objects.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="testpass123",
-        first_name="Test",
-        last_name="User",
-    )
+@pytest.fixture(scope="session")
+def user(session_transaction, django_db_blocker):
+    """Create a test user shared by the whole session."""
+    with django_db_blocker.unblock():
+        return User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            first_name="Test",
+            last_name="User",
+        )
 
 
-@pytest.fixture
-def admin_user():
-    """Create an admin user."""
-    from django.contrib.auth.models import User
+@pytest.fixture(scope="session")
+def login_tokens(user, django_db_blocker):
+    """Issue one JWT refresh/access pair for the test user per session."""
+    from rest_framework_simplejwt.tokens import RefreshToken
 
-    return User.objects.create_superuser(
-        username="admin", email="admin@example.com", password="adminpass123"
-    )
+    with django_db_blocker.unblock():
+        refresh = RefreshToken.for_user(user)
+    return {"refresh": str(refresh), "access": str(refresh.access_token)}
+
+
+@pytest.fixture(scope="session")
+def admin_user(session_transaction, django_db_blocker):
+    """Create an admin user shared by the whole session."""
+    with django_db_blocker.unblock():
+        return User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="adminpass123"
+        )
 
 
+# Classic-models fixtures are opt-in (never autouse) and function-scoped: tests
+# reuse the same primary keys, so each test builds only the rows it requests.
 @pytest.fixture
 def office():
     """Create a test office."""
-    from classicmodels.models import Office
-
     return Office.objects.create(
         officecode="TEST001",
         city="Test City",
@@ -221,8 +239,6 @@ def office():
 @pytest.fixture
 def employee(office):
     """Create a test employee."""
-    from classicmodels.models import Employee
-
     return Employee.objects.create(
         employeenumber=1001,
         lastname="Doe",
@@ -237,8 +253,6 @@ def employee(office):
 @pytest.fixture
 def manager_employee(office):
     """Create a test manager employee."""
-    from classicmodels.models import Employee
-
     return Employee.objects.create(
         employeenumber=1000,
         lastname="Smith",
@@ -253,8 +267,6 @@ def manager_employee(office):
 @pytest.fixture
 def customer(employee):
     """Create a test customer."""
-    from classicmodels.models import Customer
-
     return Customer.objects.create(
         customernumber=1001,
         customername="Test Customer Inc.",
@@ -272,8 +284,6 @@ def customer(employee):
 @pytest.fixture
 def product_line():
     """Create a test product line."""
-    from classicmodels.models import ProductLine
-
     return ProductLine.objects.create(
         productline="Test Line",
         textdescription="Test product line description",
@@ -284,8 +294,6 @@ def product_line():
 @pytest.fixture
 def product(product_line):
     """Create a test product."""
-    from classicmodels.models import Product
-
     return Product.objects.create(
         productcode="TEST001",
         productname="Test Product",
@@ -302,8 +310,6 @@ def product(product_line):
 @pytest.fixture
 def order(customer):
     """Create a test order."""
-    from classicmodels.models import Order
-
     return Order.objects.create(
         ordernumber=10001,
         orderdate="2024-01-15",
@@ -318,8 +324,6 @@ def order(customer):
 @pytest.fixture
 def order_detail(order, product):
     """Create a test order detail."""
-    from classicmodels.models import Orderdetail
-
     return Orderdetail.objects.create(
         ordernumber=order,
         productcode=product,
@@ -332,8 +336,6 @@ def order_detail(order, product):
 @pytest.fixture
 def payment(customer):
     """Create a test payment."""
-    from classicmodels.models import Payment
-
     return Payment.objects.create(
         customernumber=customer,
         checknumber="TEST001",
@@ -342,46 +344,119 @@ def payment(customer):
     )
 
 
+@pytest.fixture(scope="module")
+def shared_office(session_transaction, django_db_blocker):
+    """Create an office shared by one test module.
+
+    Only for read-only tests. The row lives in a savepoint that is rolled
+    back when the module finishes, and uses a key that does not collide
+    with the per-test fixtures above.
+    """
+    with _rolled_back_atomic(django_db_blocker):
+        with django_db_blocker.unblock():
+            office = Office.objects.create(
+                officecode="SHARED1",
+                city="Shared City",
+                phone="+1-555-0900",
+                addressline1="900 Shared Street",
+                country="USA",
+                postalcode="90000",
+                territory="NA",
+            )
+
+        yield office
+
+
+@pytest.fixture(scope="module")
+def shared_employee(shared_office, django_db_blocker):
+    """Create a sales rep in the shared office for one test module.
+
+    Only for read-only tests; rolled back like shared_office.
+    """
+    with _rolled_back_atomic(django_db_blocker):
+        with django_db_blocker.unblock():
+            employee = Employee.objects.create(
+                employeenumber=9001,
+                lastname="Shared",
+                firstname="Sam",
+                extension="9001",
+                email="sam.shared@example.com",
+                officecode=shared_office,
+                jobtitle="Sales Rep",
+            )
+
+        yield employee
+
+
+@pytest.fixture(scope="module")
+def shared_customer(shared_employee, django_db_blocker):
+    """Create a customer of the shared sales rep for one test module.
+
+    Only for read-only tests; rolled back like shared_employee.
+    """
+    with _rolled_back_atomic(django_db_blocker):
+        with django_db_blocker.unblock():
+            customer = Customer.objects.create(
+                customernumber=9001,
+                customername="Shared Customer Inc.",
+                contactlastname="Shared",
+                contactfirstname="Pat",
+                phone="+1-555-0901",
+                addressline1="901 Shared Ave",
+                city="Shared City",
+                country="USA",
+                salesrepemployeenumber=shared_employee,
+                creditlimit=50000.00,
+            )
+
+        yield customer
+
+
+@pytest.fixture
+def next_customer_number():
+    """Return a callable handing out customer numbers no fixture uses."""
+    counter = itertools.count(100000)
+    return lambda: next(counter)
+
+
 @pytest.fixture
 def multiple_offices():
     """Create multiple test offices."""
-    from classicmodels.models import Office
-
-    offices = []
-    for i in range(3):
-        office = Office.objects.create(
-            officecode=f"OFF{i+1:03d}",
-            city=f"City {i+1}",
-            phone=f"+1-555-{1000+i:04d}",
-            addressline1=f"{100+i} Street",
-            country="USA",
-            postalcode=f"{10000+i}",
-            territory="NA",
+    return Office.objects.bulk_create(
+        (
+            Office(
+                officecode=f"OFF{i+1:03d}",
+                city=f"City {i+1}",
+                phone=f"+1-555-{1000+i:04d}",
+                addressline1=f"{100+i} Street",
+                country="USA",
+                postalcode=f"{10000+i}",
+                territory="NA",
+            )
+            for i in range(3)
         )
-        offices.append(office)
-    return offices
+    )
 
 
 @pytest.fixture
 def multiple_products(product_line):
     """Create multiple test products."""
-    from classicmodels.models import Product
-
-    products = []
-    for i in range(5):
-        product = Product.objects.create(
-            productcode=f"PROD{i+1:03d}",
-            productname=f"Product {i+1}",
-            productline=product_line,
-            productscale="1:10",
-            productvendor=f"Vendor {i+1}",
-            productdescription=f"Description for product {i+1}",
-            quantityinstock=50 + i * 10,
-            buyprice=20.00 + i * 5.00,
-            msrp=35.00 + i * 8.00,
+    return Product.objects.bulk_create(
+        (
+            Product(
+                productcode=f"PROD{i+1:03d}",
+                productname=f"Product {i+1}",
+                productline=product_line,
+                productscale="1:10",
+                productvendor=f"Vendor {i+1}",
+                productdescription=f"Description for product {i+1}",
+                quantityinstock=50 + i * 10,
+                buyprice=20.00 + i * 5.00,
+                msrp=35.00 + i * 8.00,
+            )
+            for i in range(5)
         )
-        products.append(product)
-    return products
+    )
 
 
 @pytest.fixture
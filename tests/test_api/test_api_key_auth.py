@@ -91,11 +91,11 @@ class TestApiKeyAuthentication:
         """Test that API key authentication works as alternative to JWT"""
         # Create a user and get JWT token
         user = User.objects.create_user(
-            username="testuser", password="testpass123", email="test@example.com"
+            username="jwtuser", password="testpass123", email="jwt@example.com"
         )
         login_response = self.client.post(
             "/classic-models/api/auth/login/",
-            {"username": "testuser", "password": "testpass123"},
+            {"username": "jwtuser", "password": "testpass123"},
             format="json",
         )
         jwt_token = login_response.data["access"]
@@ -9,14 +9,24 @@ from rest_framework import status
 
 from authentication.serializers import UserSerializer
 
+# Resolve the endpoint URLs once instead of walking the resolver in every test
+SIGNUP_URL = reverse("signup")
+LOGIN_URL = reverse("login")
+LOGOUT_URL = reverse("logout")
+TOKEN_REFRESH_URL = reverse("token_refresh")
+CURRENT_USER_URL = reverse("current_user")
+
+# Stands in for the shared user's username in parametrize data, which is
+# built before the user fixture exists
+EXISTING_USERNAME = object()
+
 
 class TestAuthenticationAPI:
     """Test cases for authentication API endpoints."""
 
     @pytest.mark.django_db
-    def test_register_success(self, api_client):
+    def test_register_success(self, api_client, django_assert_num_queries):
         """Test successful user registration."""
-        url = reverse("signup")
         data = {
             "username": "newuser",
             "email": "newuser@example.com",
@@ -26,7 +36,9 @@ class TestAuthenticationAPI:
             "password_confirm": "newpass123",
         }
 
-        response = api_client.post(url, data, format="json")
+        # Username uniqueness check + user INSERT
+        with django_assert_num_queries(2):
+            response = api_client.post(SIGNUP_URL, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
         assert "message" in response.data
@@ -41,83 +53,75 @@ class TestAuthenticationAPI:
         )  # Password should not be returned
 
     @pytest.mark.django_db
-    def test_register_password_mismatch(self, api_client):
-        """Test registration with mismatched passwords."""
-        url = reverse("signup")
+    @pytest.mark.parametrize(
+        "data,expected_errors",
+        [
+            pytest.param(
+                {
+                    "username": "newuser",
+                    "email": "newuser@example.com",
+                    "first_name": "New",
+                    "last_name": "User",
+                    "password": "newpass123",
+                    "password_confirm": "differentpass",
+                },
+                ["password_confirm"],
+                id="password_mismatch",
+            ),
+            pytest.param(
+                {
+                    "username": "newuser",
+                    "email": "newuser@example.com",
+                    "first_name": "New",
+                    "last_name": "User",
+                    "password": "short",
+                    "password_confirm": "short",
+                },
+                ["password"],
+                id="short_password",
+            ),
+            pytest.param(
+                {
+                    "username": EXISTING_USERNAME,
+                    "email": "different@example.com",
+                    "first_name": "Different",
+                    "last_name": "User",
+                    "password": "newpass123",
+                    "password_confirm": "newpass123",
+                },
+                ["username"],
+                id="duplicate_username",
+            ),
+            pytest.param(
+                {
+                    "username": "newuser",
+                    # Missing other required fields
+                },
+                ["email", "first_name", "last_name", "password"],
+                id="missing_fields",
+            ),
+        ],
+    )
+    def test_register_failure(self, api_client, user, data, expected_errors):
+        """Test registration with invalid data."""
         data = {
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "first_name": "New",
-            "last_name": "User",
-            "password": "newpass123",
-            "password_confirm": "differentpass",
+            field: user.username if value is EXISTING_USERNAME else value
+            for field, value in data.items()
         }
-
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(SIGNUP_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "password_confirm" in response.data
+        for field in expected_errors:
+            assert field in response.data
 
     @pytest.mark.django_db
-    def test_register_short_password(self, api_client):
-        """Test registration with password too short."""
-        url = reverse("signup")
-        data = {
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "first_name": "New",
-            "last_name": "User",
-            "password": "short",
-            "password_confirm": "short",
-        }
-
-        response = api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "password" in response.data
-
-    @pytest.mark.django_db
-    def test_register_duplicate_username(self, api_client, user):
-        """Test registration with duplicate username."""
-        url = reverse("signup")
-        data = {
-            "username": user.username,  # Existing username
-            "email": "different@example.com",
-            "first_name": "Different",
-            "last_name": "User",
-            "password": "newpass123",
-            "password_confirm": "newpass123",
-        }
-
-        response = api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "username" in response.data
-
-    @pytest.mark.django_db
-    def test_register_missing_fields(self, api_client):
-        """Test registration with missing required fields."""
-        url = reverse("signup")
-        data = {
-            "username": "newuser",
-            # Missing other required fields
-        }
-
-        response = api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "email" in response.data
-        assert "first_name" in response.data
-        assert "last_name" in response.data
-        assert "password" in response.data
-
-    @pytest.mark.django_db
-    def test_login_success(self, api_client, user):
+    def test_login_success(self, api_client, user, django_assert_num_queries):
         """Test successful user login."""
-        url = reverse("login")
         data = {"username": user.username, "password": "testpass123"}
 
-        response = api_client.post(url, data, format="json")
+        # User lookup + OutstandingToken INSERT for the blacklist app
+        with django_assert_num_queries(2):
+            response = api_client.post(LOGIN_URL, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
         assert "access" in response.data
@@ -129,10 +133,9 @@ class TestAuthenticationAPI:
     @pytest.mark.django_db
     def test_login_invalid_credentials(self, api_client):
         """Test login with invalid credentials."""
-        url = reverse("login")
         data = {"username": "nonexistent", "password": "wrongpassword"}
 
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(LOGIN_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "non_field_errors" in response.data
@@ -148,10 +151,9 @@ class TestAuthenticationAPI:
             is_active=False,
         )
 
-        url = reverse("login")
         data = {"username": inactive_user.username, "password": "testpass123"}
 
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(LOGIN_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "non_field_errors" in response.data
@@ -159,84 +161,54 @@ class TestAuthenticationAPI:
     @pytest.mark.django_db
     def test_login_missing_fields(self, api_client):
         """Test login with missing fields."""
-        url = reverse("login")
         data = {
             "username": "testuser",
             # Missing password
         }
 
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(LOGIN_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "password" in response.data
 
     @pytest.mark.django_db
-    def test_logout_success(self, api_client, user):
+    def test_logout_success(self, authenticated_api_client, login_tokens):
         """Test successful user logout."""
-        # First login to get tokens
-        login_url = reverse("login")
-        login_data = {"username": user.username, "password": "testpass123"}
-        login_response = api_client.post(login_url, login_data, format="json")
-        access_token = login_response.data["access"]
-        refresh_token = login_response.data["refresh"]
-
-        # Now logout using the access token for authentication
-        url = reverse("logout")
-        data = {"refresh": refresh_token}
+        data = {"refresh": login_tokens["refresh"]}
 
-        # Use the access token for authentication
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-        response = api_client.post(url, data, format="json")
+        response = authenticated_api_client.post(LOGOUT_URL, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
         assert "message" in response.data
 
     @pytest.mark.django_db
-    def test_logout_missing_token(self, api_client, user):
+    def test_logout_missing_token(self, authenticated_api_client):
         """Test logout without refresh token."""
-        # First login to get access token
-        login_url = reverse("login")
-        login_data = {"username": user.username, "password": "testpass123"}
-        login_response = api_client.post(login_url, login_data, format="json")
-        access_token = login_response.data["access"]
-
-        # Now logout without refresh token
-        url = reverse("logout")
         data = {}  # Missing refresh token
 
-        # Use the access token for authentication
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-        response = api_client.post(url, data, format="json")
+        response = authenticated_api_client.post(LOGOUT_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
     @pytest.mark.django_db
-    def test_logout_invalid_token(self, api_client, user):
+    def test_logout_invalid_token(self, authenticated_api_client):
         """Test logout with invalid refresh token."""
-        # First login to get access token
-        login_url = reverse("login")
-        login_data = {"username": user.username, "password": "testpass123"}
-        login_response = api_client.post(login_url, login_data, format="json")
-        access_token = login_response.data["access"]
-
-        # Now logout with invalid refresh token
-        url = reverse("logout")
         data = {"refresh": "invalid_token"}
 
-        # Use the access token for authentication
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-        response = api_client.post(url, data, format="json")
+        response = authenticated_api_client.post(LOGOUT_URL, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
     @pytest.mark.django_db
-    def test_current_user_authenticated(self, authenticated_api_client, user):
+    def test_current_user_authenticated(
+        self, authenticated_api_client, user, django_assert_num_queries
+    ):
         """Test getting current user when authenticated."""
-        url = reverse("current_user")
-
-        response = authenticated_api_client.get(url)
+        # force_authenticate supplies the user, so no lookup is needed
+        with django_assert_num_queries(0):
+            response = authenticated_api_client.get(CURRENT_USER_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["username"] == user.username
@@ -247,26 +219,16 @@ class TestAuthenticationAPI:
     @pytest.mark.django_db
     def test_current_user_unauthenticated(self, api_client):
         """Test getting current user when not authenticated."""
-        url = reverse("current_user")
-
-        response = api_client.get(url)
+        response = api_client.get(CURRENT_USER_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     @pytest.mark.django_db
-    def test_token_refresh(self, api_client, user):
+    def test_token_refresh(self, api_client, login_tokens):
         """Test token refresh functionality."""
-        # First login to get tokens
-        login_url = reverse("login")
-        login_data = {"username": user.username, "password": "testpass123"}
-        login_response = api_client.post(login_url, login_data, format="json")
-        refresh_token = login_response.data["refresh"]
-
-        # Now refresh the token
-        url = reverse("token_refresh")
-        data = {"refresh": refresh_token}
+        data = {"refresh": login_tokens["refresh"]}
 
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(TOKEN_REFRESH_URL, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
         assert "access" in response.data
@@ -274,10 +236,9 @@ class TestAuthenticationAPI:
     @pytest.mark.django_db
     def test_token_refresh_invalid_token(self, api_client):
         """Test token refresh with invalid token."""
-        url = reverse("token_refresh")
         data = {"refresh": "invalid_token"}
 
-        response = api_client.post(url, data, format="json")
+        response = api_client.post(TOKEN_REFRESH_URL, data, format="json")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -302,8 +263,8 @@ class TestAuthenticationAPI:
 
         # Test password mismatch
         data = {
-            "username": "testuser",
-            "email": "test@example.com",
+            "username": "newuser",
+            "email": "newuser@example.com",
             "first_name": "Test",
             "last_name": "User",
             "password": "password123",
@@ -320,8 +281,8 @@ class TestAuthenticationAPI:
         from authentication.serializers import RegisterSerializer
 
         data = {
-            "username": "testuser",
-            "email": "test@example.com",
+            "username": "newuser",
+            "email": "newuser@example.com",
             "first_name": "Test",
             "last_name": "User",
             "password": "password123",
@@ -332,8 +293,8 @@ class TestAuthenticationAPI:
         assert serializer.is_valid()
 
         user = serializer.save()
-        assert user.username == "testuser"
-        assert user.email == "test@example.com"
+        assert user.username == "newuser"
+        assert user.email == "newuser@example.com"
         assert user.first_name == "Test"
         assert user.last_name == "User"
         assert user.check_password("password123")
@@ -366,26 +327,22 @@ class TestAuthenticationAPI:
     def test_authentication_endpoints_require_authentication(self, api_client):
         """Test that protected endpoints require authentication."""
         # Test logout endpoint
-        logout_url = reverse("logout")
-        response = api_client.post(logout_url, {})
+        response = api_client.post(LOGOUT_URL, {})
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
         # Test current user endpoint
-        current_user_url = reverse("current_user")
-        response = api_client.get(current_user_url)
+        response = api_client.get(CURRENT_USER_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     @pytest.mark.django_db
     def test_authentication_endpoints_allow_anonymous(self, api_client):
         """Test that public endpoints allow anonymous access."""
         # Test signup endpoint
-        register_url = reverse("signup")
         response = api_client.get(
-            register_url
+            SIGNUP_URL
         )  # GET should return 405 Method Not Allowed
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
         # Test login endpoint
-        login_url = reverse("login")
-        response = api_client.get(login_url)  # GET should return 405 Method Not Allowed
+        response = api_client.get(LOGIN_URL)  # GET should return 405 Method Not Allowed
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -2,82 +2,128 @@
 Tests for Customer API endpoints.
 """
 
+from types import MappingProxyType
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
 
 from classicmodels.models import Customer
 
+# Resolve the customer URLs once; detail URLs only differ by customernumber
+CUSTOMER_LIST_URL = reverse("classicmodels:customer-list")
+CUSTOMER_DETAIL_URL = CUSTOMER_LIST_URL + "/{}"
+CUSTOMER_ORDERS_URL = CUSTOMER_DETAIL_URL + "/orders"
+CUSTOMER_PAYMENTS_URL = CUSTOMER_DETAIL_URL + "/payments"
+
+# Required customer fields shared by the create/update tests; each test adds
+# the customernumber and sales rep and overrides whatever it is exercising.
+# Read-only so a test cannot leak changes into the next one.
+BASE_CUSTOMER_DATA = MappingProxyType(
+    {
+        "customername": "Test Customer",
+        "contactlastname": "Smith",
+        "contactfirstname": "John",
+        "phone": "+1-555-0000",
+        "addressline1": "123 Test Ave",
+        "city": "Test City",
+        "country": "USA",
+    }
+)
+
 
 class TestCustomerAPI:
     """Test cases for Customer API endpoints."""
 
-    @pytest.mark.django_db
-    def test_list_customers_authenticated(self, authenticated_api_client, customer):
-        """Test listing customers when authenticated."""
-        url = reverse("classicmodels:customer-list")
-        response = authenticated_api_client.get(url)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["results"]) == 1
-        assert response.data["results"][0]["customernumber"] == customer.customernumber
+    @pytest.mark.parametrize(
+        "url_template,url_name",
+        [
+            (CUSTOMER_DETAIL_URL, "classicmodels:customer-detail"),
+            (CUSTOMER_ORDERS_URL, "classicmodels:customer-orders"),
+            (CUSTOMER_PAYMENTS_URL, "classicmodels:customer-payments"),
+        ],
+    )
+    def test_customer_url_templates(self, url_template, url_name):
+        """Test that the precomputed URL templates match reverse()."""
+        assert url_template.format(1001) == reverse(
+            url_name, kwargs={"customernumber": 1001}
+        )
 
     @pytest.mark.django_db
-    def test_list_customers_unauthenticated(self, api_client, customer):
-        """Test listing customers when not authenticated."""
-        url = reverse("classicmodels:customer-list")
+    def test_list_customers_authenticated(
+        self, api_client, login_tokens, shared_customer, unpaginated
+    ):
+        """Test listing customers when authenticated."""
+        # Use a real JWT here; the other tests rely on force_authenticate
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {login_tokens['access']}")
+        url = CUSTOMER_LIST_URL
         response = api_client.get(url)
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1
+        assert response.data[0]["customernumber"] == shared_customer.customernumber
 
     @pytest.mark.django_db
-    def test_retrieve_customer_authenticated(self, authenticated_api_client, customer):
+    def test_retrieve_customer_authenticated(
+        self, authenticated_api_client, shared_customer
+    ):
         """Test retrieving a specific customer when authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_DETAIL_URL.format(shared_customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["customernumber"] == customer.customernumber
-        assert response.data["customername"] == customer.customername
+        assert response.data["customernumber"] == shared_customer.customernumber
+        assert response.data["customername"] == shared_customer.customername
 
-    @pytest.mark.django_db
-    def test_retrieve_customer_unauthenticated(self, api_client, customer):
-        """Test retrieving a customer when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        response = api_client.get(url)
+    @pytest.mark.parametrize("method", ["get", "post"])
+    def test_customer_list_unauthenticated(self, api_client, method):
+        """Test that the customer list endpoint requires authentication."""
+        url = CUSTOMER_LIST_URL
+        response = getattr(api_client, method)(url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize(
+        "url_template,method",
+        [
+            (CUSTOMER_DETAIL_URL, "get"),
+            (CUSTOMER_DETAIL_URL, "put"),
+            (CUSTOMER_DETAIL_URL, "patch"),
+            (CUSTOMER_DETAIL_URL, "delete"),
+            (CUSTOMER_ORDERS_URL, "get"),
+            (CUSTOMER_PAYMENTS_URL, "get"),
+        ],
+    )
+    def test_customer_detail_unauthenticated(self, api_client, url_template, method):
+        """Test that customer detail endpoints require authentication."""
+        # The 401 is raised before the customer is looked up, so no row is needed
+        url = url_template.format(1)
+        response = getattr(api_client, method)(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     @pytest.mark.django_db
     def test_retrieve_nonexistent_customer(self, authenticated_api_client):
         """Test retrieving a customer that doesn't exist."""
-        url = reverse("classicmodels:customer-detail", kwargs={"customernumber": 99999})
+        url = CUSTOMER_DETAIL_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.django_db
-    def test_create_customer_authenticated(self, authenticated_api_client, employee):
+    def test_create_customer_authenticated(
+        self, authenticated_api_client, employee, next_customer_number
+    ):
         """Test creating a customer when authenticated."""
-        url = reverse("classicmodels:customer-list")
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 2001,
+            **BASE_CUSTOMER_DATA,
+            "customernumber": customernumber,
             "customername": "New Customer Inc.",
-            "contactlastname": "Smith",
-            "contactfirstname": "John",
-            "phone": "+1-555-9999",
-            "addressline1": "999 New Street",
             "addressline2": "Suite 500",
-            "city": "New City",
             "state": "NY",
             "postalcode": "10001",
-            "country": "USA",
             "salesrepemployeenumber": employee.employeenumber,
             "creditlimit": "50000.00",
         }
@@ -85,91 +131,68 @@ class TestCustomerAPI:
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["customernumber"] == 2001
+        assert response.data["customernumber"] == customernumber
         assert response.data["customername"] == "New Customer Inc."
 
-    @pytest.mark.django_db
-    def test_create_customer_unauthenticated(self, api_client, employee):
-        """Test creating a customer when not authenticated."""
-        url = reverse("classicmodels:customer-list")
-        data = {
-            "customernumber": 2001,
-            "customername": "New Customer Inc.",
-            "contactlastname": "Smith",
-            "contactfirstname": "John",
-            "phone": "+1-555-9999",
-            "addressline1": "999 New Street",
-            "city": "New City",
-            "country": "USA",
-            "salesrepemployeenumber": employee.employeenumber,
-        }
-
-        response = api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_create_customer_duplicate_number(
-        self, authenticated_api_client, customer, employee
+        self,
+        authenticated_api_client,
+        customer,
+        employee,
+        django_assert_max_num_queries,
     ):
         """Test creating a customer with duplicate customer number."""
-        url = reverse("classicmodels:customer-list")
+        url = CUSTOMER_LIST_URL
         data = {
+            **BASE_CUSTOMER_DATA,
             "customernumber": customer.customernumber,  # Duplicate
-            "customername": "Duplicate Customer",
-            "contactlastname": "Duplicate",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Duplicate Ave",
-            "city": "Duplicate City",
-            "country": "USA",
             "salesrepemployeenumber": employee.employeenumber,
         }
 
-        response = authenticated_api_client.post(url, data, format="json")
+        # The serializer rejects the duplicate (uniqueness check + sales rep
+        # lookup) before any INSERT is attempted
+        with django_assert_max_num_queries(2):
+            response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @pytest.mark.django_db
-    def test_create_customer_invalid_sales_rep(self, authenticated_api_client):
+    def test_create_customer_invalid_sales_rep(
+        self, authenticated_api_client, next_customer_number, django_assert_num_queries
+    ):
         """Test creating a customer with invalid sales rep."""
-        url = reverse("classicmodels:customer-list")
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 2002,
-            "customername": "Invalid Sales Rep Customer",
-            "contactlastname": "Invalid",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Invalid Ave",
-            "city": "Invalid City",
-            "country": "USA",
+            **BASE_CUSTOMER_DATA,
+            "customernumber": customernumber,
             "salesrepemployeenumber": 99999,  # Invalid sales rep
         }
 
-        response = authenticated_api_client.post(url, data, format="json")
+        # customernumber uniqueness check + sales rep lookup; no INSERT attempted
+        with django_assert_num_queries(2):
+            response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @pytest.mark.django_db
-    def test_create_customer_minimal_data(self, authenticated_api_client, employee):
+    def test_create_customer_minimal_data(
+        self, authenticated_api_client, employee, next_customer_number
+    ):
         """Test creating a customer with minimal required data."""
-        url = reverse("classicmodels:customer-list")
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 2003,
-            "customername": "Minimal Customer",
-            "contactlastname": "Minimal",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Minimal Ave",
-            "city": "Minimal City",
-            "country": "USA",
+            **BASE_CUSTOMER_DATA,
+            "customernumber": customernumber,
             "salesrepemployeenumber": employee.employeenumber,
         }
 
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["customernumber"] == 2003
+        assert response.data["customernumber"] == customernumber
         assert response.data["addressline2"] is None
         assert response.data["state"] is None
         assert response.data["postalcode"] is None
@@ -178,23 +201,16 @@ class TestCustomerAPI:
     @pytest.mark.django_db
     def test_update_customer_authenticated(self, authenticated_api_client, customer):
         """Test updating a customer when authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_DETAIL_URL.format(customer.customernumber)
         data = {
+            **BASE_CUSTOMER_DATA,
             "customernumber": customer.customernumber,
             "customername": "Updated Customer Inc.",
-            "contactlastname": "Updated",
-            "contactfirstname": "John",
             "phone": "+1-555-8888",
-            "addressline1": "888 Updated Street",
             "addressline2": "Suite 888",
-            "city": "Updated City",
             "state": "CA",
             "postalcode": "90210",
-            "country": "USA",
-            "salesrepemployeenumber": customer.salesrepemployeenumber.employeenumber,
+            "salesrepemployeenumber": customer.salesrepemployeenumber_id,
             "creditlimit": "75000.00",
         }
 
@@ -204,38 +220,12 @@ class TestCustomerAPI:
         assert response.data["customername"] == "Updated Customer Inc."
         assert response.data["phone"] == "+1-555-8888"
 
-    @pytest.mark.django_db
-    def test_update_customer_unauthenticated(self, api_client, customer):
-        """Test updating a customer when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        data = {
-            "customernumber": customer.customernumber,
-            "customername": "Updated Customer Inc.",
-            "contactlastname": "Updated",
-            "contactfirstname": "John",
-            "phone": "+1-555-8888",
-            "addressline1": "888 Updated Street",
-            "city": "Updated City",
-            "country": "USA",
-            "salesrepemployeenumber": customer.salesrepemployeenumber.employeenumber,
-        }
-
-        response = api_client.put(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_partial_update_customer_authenticated(
         self, authenticated_api_client, customer
     ):
         """Test partially updating a customer when authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_DETAIL_URL.format(customer.customernumber)
         data = {"customername": "Partially Updated Customer", "phone": "+1-555-7777"}
 
         response = authenticated_api_client.patch(url, data, format="json")
@@ -246,26 +236,10 @@ class TestCustomerAPI:
         # Other fields should remain unchanged
         assert response.data["customernumber"] == customer.customernumber
 
-    @pytest.mark.django_db
-    def test_partial_update_customer_unauthenticated(self, api_client, customer):
-        """Test partially updating a customer when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        data = {"customername": "Partially Updated Customer"}
-
-        response = api_client.patch(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_delete_customer_authenticated(self, authenticated_api_client, customer):
         """Test deleting a customer when authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_DETAIL_URL.format(customer.customernumber)
         response = authenticated_api_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -273,135 +247,72 @@ class TestCustomerAPI:
             customernumber=customer.customernumber
         ).exists()
 
-    @pytest.mark.django_db
-    def test_delete_customer_unauthenticated(self, api_client, customer):
-        """Test deleting a customer when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        response = api_client.delete(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_delete_nonexistent_customer(self, authenticated_api_client):
         """Test deleting a customer that doesn't exist."""
-        url = reverse("classicmodels:customer-detail", kwargs={"customernumber": 99999})
+        url = CUSTOMER_DETAIL_URL.format(99999)
         response = authenticated_api_client.delete(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.django_db
-    def test_customer_serializer_validation(self, authenticated_api_client, employee):
-        """Test customer serializer validation."""
-        url = reverse("classicmodels:customer-list")
-
-        # Test with invalid data (exceeds max length)
-        data = {
-            "customernumber": 3001,
-            "customername": "x" * 51,  # Exceeds max_length=50
-            "contactlastname": "Valid",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Valid Ave",
-            "city": "Valid City",
-            "country": "USA",
-            "salesrepemployeenumber": employee.employeenumber,
-        }
-
-        response = authenticated_api_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    @pytest.mark.django_db
-    def test_customer_credit_limit_precision(self, authenticated_api_client, employee):
-        """Test credit limit decimal precision."""
-        url = reverse("classicmodels:customer-list")
+    @pytest.mark.parametrize(
+        "field,value,expected_status",
+        [
+            ("phone", "+1-555-0123", status.HTTP_201_CREATED),
+            ("phone", "(555) 123-4567", status.HTTP_201_CREATED),
+            ("phone", "555-123-4567", status.HTTP_201_CREATED),
+            ("phone", "5551234567", status.HTTP_201_CREATED),
+            ("phone", "+44 20 7946 0958", status.HTTP_201_CREATED),
+            ("phone", "+33 1 42 86 83 26", status.HTTP_201_CREATED),
+            ("postalcode", "12345", status.HTTP_201_CREATED),  # US ZIP
+            ("postalcode", "12345-6789", status.HTTP_201_CREATED),  # US ZIP+4
+            ("postalcode", "K1A 0A6", status.HTTP_201_CREATED),  # Canadian
+            ("postalcode", "SW1A 1AA", status.HTTP_201_CREATED),  # UK
+            ("postalcode", "75001", status.HTTP_201_CREATED),  # French
+            ("postalcode", "100-0001", status.HTTP_201_CREATED),  # Japanese
+            ("creditlimit", "-1000.00", status.HTTP_201_CREATED),
+            ("creditlimit", "0.00", status.HTTP_201_CREATED),
+            # Max value for (10,2)
+            ("creditlimit", "99999999.99", status.HTTP_201_CREATED),
+            # Exceeds max_length=50
+            ("customername", "x" * 51, status.HTTP_400_BAD_REQUEST),
+        ],
+    )
+    def test_create_customer_variant(
+        self,
+        authenticated_api_client,
+        employee,
+        next_customer_number,
+        field,
+        value,
+        expected_status,
+    ):
+        """Test creating customers with varied field values."""
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 3002,
-            "customername": "Credit Customer",
-            "contactlastname": "Credit",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Credit Ave",
-            "city": "Credit City",
-            "country": "USA",
+            **BASE_CUSTOMER_DATA,
+            "customernumber": customernumber,
             "salesrepemployeenumber": employee.employeenumber,
-            "creditlimit": "99999999.99",  # Max value for (10,2)
+            field: value,
         }
 
         response = authenticated_api_client.post(url, data, format="json")
 
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["creditlimit"] == "99999999.99"
-
-    @pytest.mark.django_db
-    def test_customer_phone_formats(self, authenticated_api_client, employee):
-        """Test various phone number formats."""
-        url = reverse("classicmodels:customer-list")
-        phone_formats = [
-            "+1-555-0123",
-            "(555) 123-4567",
-            "555-123-4567",
-            "5551234567",
-            "+44 20 7946 0958",
-            "+33 1 42 86 83 26",
-        ]
-
-        for i, phone in enumerate(phone_formats):
-            data = {
-                "customernumber": 3010 + i,
-                "customername": f"Phone Customer {i}",
-                "contactlastname": f"Phone{i}",
-                "contactfirstname": "Test",
-                "phone": phone,
-                "addressline1": f"{100+i} Phone Ave",
-                "city": f"Phone City {i}",
-                "country": "USA",
-                "salesrepemployeenumber": employee.employeenumber,
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["phone"] == phone
-
-    @pytest.mark.django_db
-    def test_customer_postal_code_formats(self, authenticated_api_client, employee):
-        """Test various postal code formats."""
-        url = reverse("classicmodels:customer-list")
-        postal_codes = [
-            "12345",  # US ZIP
-            "12345-6789",  # US ZIP+4
-            "K1A 0A6",  # Canadian postal code
-            "SW1A 1AA",  # UK postal code
-            "75001",  # French postal code
-            "100-0001",  # Japanese postal code
-        ]
-
-        for i, postal_code in enumerate(postal_codes):
-            data = {
-                "customernumber": 3020 + i,
-                "customername": f"Postal Customer {i}",
-                "contactlastname": f"Postal{i}",
-                "contactfirstname": "Test",
-                "phone": "+1-555-0000",
-                "addressline1": f"{100+i} Postal Ave",
-                "city": f"Postal City {i}",
-                "postalcode": postal_code,
-                "country": "USA",
-                "salesrepemployeenumber": employee.employeenumber,
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["postalcode"] == postal_code
+        assert response.status_code == expected_status
+        if expected_status == status.HTTP_201_CREATED:
+            assert response.data[field] == value
 
     @pytest.mark.django_db
-    def test_customer_unicode_handling(self, authenticated_api_client, employee):
+    def test_customer_unicode_handling(
+        self, authenticated_api_client, employee, next_customer_number
+    ):
         """Test handling of unicode characters in customer."""
-        url = reverse("classicmodels:customer-list")
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 3030,
+            "customernumber": customernumber,
             "customername": "Customer with émojis 🏢 and accents",
             "contactlastname": "Doe with émojis 👤 and accents",
             "contactfirstname": "Jean with émojis 👨 and accents",
@@ -419,68 +330,30 @@ class TestCustomerAPI:
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert "émojis" in response.data["customername"]
-        assert "🏢" in response.data["customername"]
-        assert "émojis" in response.data["contactlastname"]
-        assert "👤" in response.data["contactlastname"]
-
-    @pytest.mark.django_db
-    def test_customer_negative_credit_limit(self, authenticated_api_client, employee):
-        """Test handling of negative credit limit."""
-        url = reverse("classicmodels:customer-list")
-        data = {
-            "customernumber": 3040,
-            "customername": "Negative Credit Customer",
-            "contactlastname": "Negative",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Negative Ave",
-            "city": "Negative City",
-            "country": "USA",
-            "salesrepemployeenumber": employee.employeenumber,
-            "creditlimit": "-1000.00",  # Negative credit limit
-        }
-
-        response = authenticated_api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["creditlimit"] == "-1000.00"
-
-    @pytest.mark.django_db
-    def test_customer_zero_credit_limit(self, authenticated_api_client, employee):
-        """Test handling of zero credit limit."""
-        url = reverse("classicmodels:customer-list")
-        data = {
-            "customernumber": 3041,
-            "customername": "Zero Credit Customer",
-            "contactlastname": "Zero",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Zero Ave",
-            "city": "Zero City",
-            "country": "USA",
-            "salesrepemployeenumber": employee.employeenumber,
-            "creditlimit": "0.00",
-        }
-
-        response = authenticated_api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["creditlimit"] == "0.00"
-
-    @pytest.mark.django_db
-    def test_customer_without_sales_rep(self, authenticated_api_client):
+        for field in (
+            "customername",
+            "contactlastname",
+            "contactfirstname",
+            "phone",
+            "addressline1",
+            "addressline2",
+            "city",
+            "state",
+            "postalcode",
+            "country",
+        ):
+            assert response.data[field] == data[field]
+
+    @pytest.mark.django_db
+    def test_customer_without_sales_rep(
+        self, authenticated_api_client, next_customer_number
+    ):
         """Test customer without sales rep."""
-        url = reverse("classicmodels:customer-list")
+        customernumber = next_customer_number()
+        url = CUSTOMER_LIST_URL
         data = {
-            "customernumber": 3042,
-            "customername": "No Rep Customer",
-            "contactlastname": "NoRep",
-            "contactfirstname": "Test",
-            "phone": "+1-555-0000",
-            "addressline1": "123 NoRep Ave",
-            "city": "NoRep City",
-            "country": "USA",
+            **BASE_CUSTOMER_DATA,
+            "customernumber": customernumber,
             "salesrepemployeenumber": None,
         }
 
@@ -493,20 +366,24 @@ class TestCustomerAPI:
     def test_customer_pagination(self, authenticated_api_client, employee):
         """Test customer pagination."""
         # Create additional customers beyond the existing ones
-        for i in range(15):  # More than default page size
-            Customer.objects.create(
-                customernumber=4000 + i,
-                customername=f"Pagination Customer {i}",
-                contactlastname=f"Pagination{i}",
-                contactfirstname="Test",
-                phone=f"+1-555-{1000+i:04d}",
-                addressline1=f"{100+i} Pagination Ave",
-                city=f"Pagination City {i}",
-                country="USA",
-                salesrepemployeenumber=employee,
-            )
+        Customer.objects.bulk_create(
+            [
+                Customer(
+                    customernumber=4000 + i,
+                    customername=f"Pagination Customer {i}",
+                    contactlastname=f"Pagination{i}",
+                    contactfirstname="Test",
+                    phone=f"+1-555-{1000+i:04d}",
+                    addressline1=f"{100+i} Pagination Ave",
+                    city=f"Pagination City {i}",
+                    country="USA",
+                    salesrepemployeenumber=employee,
+                )
+                for i in range(15)  # More than default page size
+            ]
+        )
 
-        url = reverse("classicmodels:customer-list")
+        url = CUSTOMER_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -516,61 +393,94 @@ class TestCustomerAPI:
         assert "results" in response.data
 
     @pytest.mark.django_db
-    def test_customer_ordering(self, authenticated_api_client, employee):
+    def test_list_customers_query_count(
+        self,
+        authenticated_api_client,
+        employee,
+        next_customer_number,
+        django_assert_num_queries,
+    ):
+        """Test that listing customers does not query per customer."""
+        Customer.objects.bulk_create(
+            [
+                Customer(
+                    **BASE_CUSTOMER_DATA,
+                    customernumber=next_customer_number(),
+                    salesrepemployeenumber=employee,
+                )
+                for _ in range(5)
+            ]
+        )
+
+        # COUNT for the paginator + one SELECT for the page; the sales rep is
+        # serialized from its FK column, so no per-customer lookups
+        with django_assert_num_queries(2):
+            response = authenticated_api_client.get(CUSTOMER_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == Customer.objects.count()
+
+    @pytest.mark.django_db
+    def test_customer_ordering(self, authenticated_api_client, employee, unpaginated):
         """Test customer ordering."""
         # Create customers in specific order
-        Customer.objects.create(
-            customernumber=5001,
-            customername="Z Customer",
-            contactlastname="Z",
-            contactfirstname="Test",
-            phone="+1-555-0000",
-            addressline1="123 Z Ave",
-            city="Z City",
-            country="USA",
-            salesrepemployeenumber=employee,
-        )
-        Customer.objects.create(
-            customernumber=5002,
-            customername="A Customer",
-            contactlastname="A",
-            contactfirstname="Test",
-            phone="+1-555-0000",
-            addressline1="123 A Ave",
-            city="A City",
-            country="USA",
-            salesrepemployeenumber=employee,
+        Customer.objects.bulk_create(
+            [
+                Customer(
+                    customernumber=5001,
+                    customername="Z Customer",
+                    contactlastname="Z",
+                    contactfirstname="Test",
+                    phone="+1-555-0000",
+                    addressline1="123 Z Ave",
+                    city="Z City",
+                    country="USA",
+                    salesrepemployeenumber=employee,
+                ),
+                Customer(
+                    customernumber=5002,
+                    customername="A Customer",
+                    contactlastname="A",
+                    contactfirstname="Test",
+                    phone="+1-555-0000",
+                    addressline1="123 A Ave",
+                    city="A City",
+                    country="USA",
+                    salesrepemployeenumber=employee,
+                ),
+            ]
         )
 
-        url = reverse("classicmodels:customer-list")
+        url = CUSTOMER_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Since no ordering is defined, order is not guaranteed
-        assert len(response.data["results"]) >= 2
+        assert len(response.data) >= 2
 
     @pytest.mark.django_db
-    def test_customer_relationships(self, authenticated_api_client, customer, employee):
+    def test_customer_relationships(
+        self, authenticated_api_client, shared_customer, django_assert_num_queries
+    ):
         """Test customer relationships in API response."""
-        url = reverse(
-            "classicmodels:customer-detail",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        response = authenticated_api_client.get(url)
+        url = CUSTOMER_DETAIL_URL.format(shared_customer.customernumber)
+        # A single SELECT for the customer; the sales rep comes from its FK column
+        with django_assert_num_queries(1):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert "salesrepemployeenumber" in response.data
-        assert response.data["salesrepemployeenumber"] == employee.employeenumber
+        assert (
+            response.data["salesrepemployeenumber"]
+            == shared_customer.salesrepemployeenumber_id
+        )
 
     @pytest.mark.django_db
     def test_get_customer_orders_authenticated(
         self, authenticated_api_client, customer, order
     ):
         """Test retrieving customer orders when authenticated."""
-        url = reverse(
-            "classicmodels:customer-orders",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_ORDERS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -583,33 +493,22 @@ class TestCustomerAPI:
             assert len(response.data) >= 1
             assert response.data[0]["ordernumber"] == order.ordernumber
 
-    @pytest.mark.django_db
-    def test_get_customer_orders_unauthenticated(self, api_client, customer):
-        """Test retrieving customer orders when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-orders",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_get_customer_orders_nonexistent_customer(self, authenticated_api_client):
         """Test retrieving orders for a customer that doesn't exist."""
-        url = reverse("classicmodels:customer-orders", kwargs={"customernumber": 99999})
+        url = CUSTOMER_ORDERS_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.django_db
-    def test_get_customer_orders_empty(self, authenticated_api_client, employee):
+    def test_get_customer_orders_empty(
+        self, authenticated_api_client, employee, next_customer_number
+    ):
         """Test retrieving orders for a customer with no orders."""
-        from classicmodels.models import Customer
-
         # Create a customer with no orders
         customer_no_orders = Customer.objects.create(
-            customernumber=2000,
+            customernumber=next_customer_number(),
             customername="No Orders Customer",
             contactlastname="NoOrders",
             contactfirstname="Test",
@@ -620,10 +519,7 @@ class TestCustomerAPI:
             salesrepemployeenumber=employee,
         )
 
-        url = reverse(
-            "classicmodels:customer-orders",
-            kwargs={"customernumber": customer_no_orders.customernumber},
-        )
+        url = CUSTOMER_ORDERS_URL.format(customer_no_orders.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -652,10 +548,7 @@ class TestCustomerAPI:
             )
             orders.append(order)
 
-        url = reverse(
-            "classicmodels:customer-orders",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_ORDERS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -683,10 +576,7 @@ class TestCustomerAPI:
                 customernumber=customer,
             )
 
-        url = reverse(
-            "classicmodels:customer-orders",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_ORDERS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -701,10 +591,7 @@ class TestCustomerAPI:
         self, authenticated_api_client, customer, payment
     ):
         """Test retrieving customer payments when authenticated."""
-        url = reverse(
-            "classicmodels:customer-payments",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_PAYMENTS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -717,35 +604,22 @@ class TestCustomerAPI:
             assert len(response.data) >= 1
             assert response.data[0]["checknumber"] == payment.checknumber
 
-    @pytest.mark.django_db
-    def test_get_customer_payments_unauthenticated(self, api_client, customer):
-        """Test retrieving customer payments when not authenticated."""
-        url = reverse(
-            "classicmodels:customer-payments",
-            kwargs={"customernumber": customer.customernumber},
-        )
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @pytest.mark.django_db
     def test_get_customer_payments_nonexistent_customer(self, authenticated_api_client):
         """Test retrieving payments for a customer that doesn't exist."""
-        url = reverse(
-            "classicmodels:customer-payments", kwargs={"customernumber": 99999}
-        )
+        url = CUSTOMER_PAYMENTS_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.django_db
-    def test_get_customer_payments_empty(self, authenticated_api_client, employee):
+    def test_get_customer_payments_empty(
+        self, authenticated_api_client, employee, next_customer_number
+    ):
         """Test retrieving payments for a customer with no payments."""
-        from classicmodels.models import Customer
-
         # Create a customer with no payments
         customer_no_payments = Customer.objects.create(
-            customernumber=2001,
+            customernumber=next_customer_number(),
             customername="No Payments Customer",
             contactlastname="NoPayments",
             contactfirstname="Test",
@@ -756,10 +630,7 @@ class TestCustomerAPI:
             salesrepemployeenumber=employee,
         )
 
-        url = reverse(
-            "classicmodels:customer-payments",
-            kwargs={"customernumber": customer_no_payments.customernumber},
-        )
+        url = CUSTOMER_PAYMENTS_URL.format(customer_no_payments.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -787,10 +658,7 @@ class TestCustomerAPI:
             )
             payments.append(payment)
 
-        url = reverse(
-            "classicmodels:customer-payments",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_PAYMENTS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -817,10 +685,7 @@ class TestCustomerAPI:
                 amount=100.00 + i * 10.00,
             )
 
-        url = reverse(
-            "classicmodels:customer-payments",
-            kwargs={"customernumber": customer.customernumber},
-        )
+        url = CUSTOMER_PAYMENTS_URL.format(customer.customernumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -2,54 +2,120 @@
 Tests for Employee API endpoints.
 """
 
+from types import MappingProxyType
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.test import force_authenticate
 
+from api.v1.classicmodels.views import EmployeeViewSet
 from classicmodels.models import Employee
 
+# Resolve the employee URLs once; detail URLs only differ by employeenumber
+EMPLOYEE_LIST_URL = reverse("classicmodels:employee-list")
+EMPLOYEE_DETAIL_URL = EMPLOYEE_LIST_URL + "/{}"
+EMPLOYEE_REPORTS_URL = EMPLOYEE_DETAIL_URL + "/reports"
+EMPLOYEE_CUSTOMERS_URL = EMPLOYEE_DETAIL_URL + "/customers"
+
+# The format tests call the create action directly, skipping middleware and
+# URL resolution; routing and auth are covered by the client-based tests.
+EMPLOYEE_CREATE_VIEW = EmployeeViewSet.as_view({"post": "create"})
+
+# Required employee fields shared by the create/update tests; each test adds
+# the employeenumber and office and overrides whatever it is exercising.
+# Read-only so a test cannot leak changes into the next one.
+BASE_EMPLOYEE_DATA = MappingProxyType(
+    {
+        "lastname": "Test",
+        "firstname": "Test",
+        "extension": "1234",
+        "email": "test@example.com",
+        "jobtitle": "Test",
+    }
+)
+
+EMAIL_FORMATS = (
+    "test@example.com",
+    "user.name@company.co.uk",
+    "firstname.lastname+tag@domain.org",
+    "user123@subdomain.example.com",
+    "test-user@example-domain.com",
+)
+EXTENSIONS = ("1234", "x1234", "1234-5678", "1234.5678", "1234x5678")
+JOB_TITLES = (
+    "Sales Rep",
+    "Sales Manager",
+    "VP Sales",
+    "President",
+    "VP Marketing",
+    "Sales Director",
+    "Account Manager",
+    "Inside Sales Rep",
+    "Outside Sales Rep",
+    "Sales Engineer",
+)
+
 
 class TestEmployeeAPI:
     """Test cases for Employee API endpoints."""
 
+    @pytest.mark.parametrize(
+        "url_template,url_name",
+        [
+            (EMPLOYEE_DETAIL_URL, "classicmodels:employee-detail"),
+            (EMPLOYEE_REPORTS_URL, "classicmodels:employee-reports"),
+            (EMPLOYEE_CUSTOMERS_URL, "classicmodels:employee-customers"),
+        ],
+    )
+    def test_employee_url_templates(self, url_template, url_name):
+        """Test that the precomputed URL templates match reverse()."""
+        assert url_template.format(1001) == reverse(
+            url_name, kwargs={"employeenumber": 1001}
+        )
+
     @pytest.mark.django_db
-    def test_list_employees_authenticated(self, authenticated_api_client, employee):
+    def test_list_employees_authenticated(
+        self, authenticated_api_client, shared_employee, django_assert_max_num_queries
+    ):
         """Test listing employees when authenticated."""
-        url = reverse("classicmodels:employee-list")
-        response = authenticated_api_client.get(url)
+        url = EMPLOYEE_LIST_URL
+        # COUNT for the paginator + one SELECT for the page
+        with django_assert_max_num_queries(2):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
-        assert response.data["results"][0]["employeenumber"] == employee.employeenumber
+        assert (
+            response.data["results"][0]["employeenumber"]
+            == shared_employee.employeenumber
+        )
 
     @pytest.mark.django_db
     def test_list_employees_unauthenticated(self, api_client, employee):
         """Test listing employees when not authenticated."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     @pytest.mark.django_db
-    def test_retrieve_employee_authenticated(self, authenticated_api_client, employee):
+    def test_retrieve_employee_authenticated(
+        self, authenticated_api_client, shared_employee, django_assert_max_num_queries
+    ):
         """Test retrieving a specific employee when authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
-        response = authenticated_api_client.get(url)
+        url = EMPLOYEE_DETAIL_URL.format(shared_employee.employeenumber)
+        with django_assert_max_num_queries(1):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["employeenumber"] == employee.employeenumber
-        assert response.data["lastname"] == employee.lastname
+        assert response.data["employeenumber"] == shared_employee.employeenumber
+        assert response.data["lastname"] == shared_employee.lastname
 
     @pytest.mark.django_db
     def test_retrieve_employee_unauthenticated(self, api_client, employee):
         """Test retrieving an employee when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -57,7 +123,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_retrieve_nonexistent_employee(self, authenticated_api_client):
         """Test retrieving an employee that doesn't exist."""
-        url = reverse("classicmodels:employee-detail", kwargs={"employeenumber": 99999})
+        url = EMPLOYEE_DETAIL_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -65,15 +131,12 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_create_employee_authenticated(self, authenticated_api_client, office):
         """Test creating an employee when authenticated."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 2001,
             "lastname": "New Employee",
-            "firstname": "John",
-            "extension": "9999",
-            "email": "john.new@example.com",
             "officecode": office.officecode,
-            "jobtitle": "New Position",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -85,15 +148,11 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_create_employee_unauthenticated(self, api_client, office):
         """Test creating an employee when not authenticated."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 2001,
-            "lastname": "New Employee",
-            "firstname": "John",
-            "extension": "9999",
-            "email": "john.new@example.com",
             "officecode": office.officecode,
-            "jobtitle": "New Position",
         }
 
         response = api_client.post(url, data, format="json")
@@ -105,15 +164,11 @@ class TestEmployeeAPI:
         self, authenticated_api_client, employee, office
     ):
         """Test creating an employee with duplicate employee number."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": employee.employeenumber,  # Duplicate
-            "lastname": "Duplicate Employee",
-            "firstname": "Jane",
-            "extension": "8888",
-            "email": "jane.duplicate@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Duplicate Position",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -122,38 +177,32 @@ class TestEmployeeAPI:
 
     @pytest.mark.django_db
     def test_create_employee_with_manager(
-        self, authenticated_api_client, office, manager_employee
+        self, authenticated_api_client, shared_employee
     ):
         """Test creating an employee with a manager."""
-        url = reverse("classicmodels:employee-list")
+        # The module's shared employee acts as the manager, so the test only
+        # inserts the subordinate it POSTs
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 2002,
-            "lastname": "Subordinate",
-            "firstname": "Bob",
-            "extension": "7777",
-            "email": "bob.subordinate@example.com",
-            "officecode": office.officecode,
-            "reportsto": manager_employee.employeenumber,
-            "jobtitle": "Subordinate Position",
+            "officecode": shared_employee.officecode_id,
+            "reportsto": shared_employee.employeenumber,
         }
 
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["reportsto"] == manager_employee.employeenumber
+        assert response.data["reportsto"] == shared_employee.employeenumber
 
     @pytest.mark.django_db
     def test_create_employee_invalid_office(self, authenticated_api_client):
         """Test creating an employee with invalid office."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 2003,
-            "lastname": "Invalid Office",
-            "firstname": "Test",
-            "extension": "6666",
-            "email": "test.invalid@example.com",
             "officecode": "NONEXISTENT",  # Invalid office
-            "jobtitle": "Test Position",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -163,15 +212,11 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_create_employee_minimal_data(self, authenticated_api_client, office):
         """Test creating an employee with minimal required data."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 2004,
-            "lastname": "Minimal",
-            "firstname": "Employee",
-            "extension": "5555",
-            "email": "minimal@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Minimal Position",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -183,18 +228,13 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_update_employee_authenticated(self, authenticated_api_client, employee):
         """Test updating an employee when authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": employee.employeenumber,
             "lastname": "Updated Employee",
-            "firstname": "Updated",
-            "extension": "4444",
             "email": "updated@example.com",
             "officecode": employee.officecode.officecode,
-            "jobtitle": "Updated Position",
         }
 
         response = authenticated_api_client.put(url, data, format="json")
@@ -206,18 +246,11 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_update_employee_unauthenticated(self, api_client, employee):
         """Test updating an employee when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": employee.employeenumber,
-            "lastname": "Updated Employee",
-            "firstname": "Updated",
-            "extension": "4444",
-            "email": "updated@example.com",
             "officecode": employee.officecode.officecode,
-            "jobtitle": "Updated Position",
         }
 
         response = api_client.put(url, data, format="json")
@@ -229,10 +262,7 @@ class TestEmployeeAPI:
         self, authenticated_api_client, employee
     ):
         """Test partially updating an employee when authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         data = {
             "lastname": "Partially Updated",
             "email": "partially.updated@example.com",
@@ -249,10 +279,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_partial_update_employee_unauthenticated(self, api_client, employee):
         """Test partially updating an employee when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         data = {"lastname": "Partially Updated"}
 
         response = api_client.patch(url, data, format="json")
@@ -262,10 +289,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_delete_employee_authenticated(self, authenticated_api_client, employee):
         """Test deleting an employee when authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         response = authenticated_api_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -276,10 +300,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_delete_employee_unauthenticated(self, api_client, employee):
         """Test deleting an employee when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_DETAIL_URL.format(employee.employeenumber)
         response = api_client.delete(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -287,7 +308,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_delete_nonexistent_employee(self, authenticated_api_client):
         """Test deleting an employee that doesn't exist."""
-        url = reverse("classicmodels:employee-detail", kwargs={"employeenumber": 99999})
+        url = EMPLOYEE_DETAIL_URL.format(99999)
         response = authenticated_api_client.delete(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -295,106 +316,82 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_employee_serializer_validation(self, authenticated_api_client, office):
         """Test employee serializer validation."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
 
         # Test with invalid data (exceeds max length)
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 3001,
             "lastname": "x" * 51,  # Exceeds max_length=50
-            "firstname": "Valid",
-            "extension": "1234",
-            "email": "valid@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Valid Position",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @pytest.mark.django_db
-    def test_employee_email_formats(self, authenticated_api_client, office):
+    @pytest.mark.parametrize("i,email", list(enumerate(EMAIL_FORMATS)))
+    def test_employee_email_formats(self, api_request_factory, user, office, i, email):
         """Test various email formats."""
-        url = reverse("classicmodels:employee-list")
-        email_formats = [
-            "test@example.com",
-            "user.name@company.co.uk",
-            "firstname.lastname+tag@domain.org",
-            "user123@subdomain.example.com",
-            "test-user@example-domain.com",
-        ]
-
-        for i, email in enumerate(email_formats):
-            data = {
-                "employeenumber": 3010 + i,
-                "lastname": f"Email{i}",
-                "firstname": "Test",
-                "extension": "1234",
-                "email": email,
-                "officecode": office.officecode,
-                "jobtitle": "Test",
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["email"] == email
-
-    @pytest.mark.django_db
-    def test_employee_extension_formats(self, authenticated_api_client, office):
+        url = EMPLOYEE_LIST_URL
+        data = {
+            **BASE_EMPLOYEE_DATA,
+            "employeenumber": 3010 + i,
+            "email": email,
+            "officecode": office.officecode,
+        }
+
+        request = api_request_factory.post(url, data, format="json")
+        force_authenticate(request, user=user)
+        response = EMPLOYEE_CREATE_VIEW(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["email"] == email
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("i,extension", list(enumerate(EXTENSIONS)))
+    def test_employee_extension_formats(
+        self, api_request_factory, user, office, i, extension
+    ):
         """Test various extension formats."""
-        url = reverse("classicmodels:employee-list")
-        extensions = ["1234", "x1234", "1234-5678", "1234.5678", "1234x5678"]
-
-        for i, extension in enumerate(extensions):
-            data = {
-                "employeenumber": 3020 + i,
-                "lastname": f"Ext{i}",
-                "firstname": "Test",
-                "extension": extension,
-                "email": f"ext{i}@example.com",
-                "officecode": office.officecode,
-                "jobtitle": "Test",
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["extension"] == extension
-
-    @pytest.mark.django_db
-    def test_employee_job_titles(self, authenticated_api_client, office):
+        url = EMPLOYEE_LIST_URL
+        data = {
+            **BASE_EMPLOYEE_DATA,
+            "employeenumber": 3020 + i,
+            "extension": extension,
+            "officecode": office.officecode,
+        }
+
+        request = api_request_factory.post(url, data, format="json")
+        force_authenticate(request, user=user)
+        response = EMPLOYEE_CREATE_VIEW(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["extension"] == extension
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("i,job_title", list(enumerate(JOB_TITLES)))
+    def test_employee_job_titles(self, api_request_factory, user, office, i, job_title):
         """Test various job titles."""
-        url = reverse("classicmodels:employee-list")
-        job_titles = [
-            "Sales Rep",
-            "Sales Manager",
-            "VP Sales",
-            "President",
-            "VP Marketing",
-            "Sales Director",
-            "Account Manager",
-            "Inside Sales Rep",
-            "Outside Sales Rep",
-            "Sales Engineer",
-        ]
-
-        for i, job_title in enumerate(job_titles):
-            data = {
-                "employeenumber": 3030 + i,
-                "lastname": f"Title{i}",
-                "firstname": "Test",
-                "extension": "1234",
-                "email": f"title{i}@example.com",
-                "officecode": office.officecode,
-                "jobtitle": job_title,
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["jobtitle"] == job_title
+        url = EMPLOYEE_LIST_URL
+        data = {
+            **BASE_EMPLOYEE_DATA,
+            "employeenumber": 3030 + i,
+            "officecode": office.officecode,
+            "jobtitle": job_title,
+        }
+
+        request = api_request_factory.post(url, data, format="json")
+        force_authenticate(request, user=user)
+        response = EMPLOYEE_CREATE_VIEW(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["jobtitle"] == job_title
 
     @pytest.mark.django_db
     def test_employee_unicode_handling(self, authenticated_api_client, office):
         """Test handling of unicode characters in employee."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
             "employeenumber": 3040,
             "lastname": "Doe émojis 🧑‍💼",
@@ -420,15 +417,12 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_employee_hierarchy_levels(self, authenticated_api_client, office):
         """Test employee hierarchy at different levels."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
 
         # Create a hierarchy: President -> VP -> Manager -> Rep
         president_data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 3050,
-            "lastname": "President",
-            "firstname": "Test",
-            "extension": "0001",
-            "email": "president@example.com",
             "officecode": office.officecode,
             "jobtitle": "President",
         }
@@ -437,11 +431,8 @@ class TestEmployeeAPI:
         assert response.status_code == status.HTTP_201_CREATED
 
         vp_data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 3051,
-            "lastname": "VP",
-            "firstname": "Test",
-            "extension": "0002",
-            "email": "vp@example.com",
             "officecode": office.officecode,
             "reportsto": 3050,
             "jobtitle": "VP Sales",
@@ -452,11 +443,8 @@ class TestEmployeeAPI:
         assert response.data["reportsto"] == 3050
 
         manager_data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 3052,
-            "lastname": "Manager",
-            "firstname": "Test",
-            "extension": "0003",
-            "email": "manager@example.com",
             "officecode": office.officecode,
             "reportsto": 3051,
             "jobtitle": "Sales Manager",
@@ -467,11 +455,8 @@ class TestEmployeeAPI:
         assert response.data["reportsto"] == 3051
 
         rep_data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 3053,
-            "lastname": "Rep",
-            "firstname": "Test",
-            "extension": "0004",
-            "email": "rep@example.com",
             "officecode": office.officecode,
             "reportsto": 3052,
             "jobtitle": "Sales Rep",
@@ -484,15 +469,11 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_employee_negative_employee_number(self, authenticated_api_client, office):
         """Test handling of negative employee numbers."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": -1,
-            "lastname": "Negative",
-            "firstname": "Test",
-            "extension": "1234",
-            "email": "negative@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Test",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -503,15 +484,11 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_employee_zero_employee_number(self, authenticated_api_client, office):
         """Test handling of zero employee number."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": 0,
-            "lastname": "Zero",
-            "firstname": "Test",
-            "extension": "1234",
-            "email": "zero@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Test",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -522,17 +499,13 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_employee_large_employee_number(self, authenticated_api_client, office):
         """Test handling of large employee numbers."""
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         large_number = 999999999  # Large integer
 
         data = {
+            **BASE_EMPLOYEE_DATA,
             "employeenumber": large_number,
-            "lastname": "Large",
-            "firstname": "Test",
-            "extension": "1234",
-            "email": "large@example.com",
             "officecode": office.officecode,
-            "jobtitle": "Test",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -541,22 +514,30 @@ class TestEmployeeAPI:
         assert response.data["employeenumber"] == large_number
 
     @pytest.mark.django_db
-    def test_employee_pagination(self, authenticated_api_client, office):
+    def test_employee_pagination(
+        self, authenticated_api_client, office, django_assert_max_num_queries
+    ):
         """Test employee pagination."""
         # Create additional employees beyond the existing ones
-        for i in range(15):  # More than default page size
-            Employee.objects.create(
-                employeenumber=4000 + i,
-                lastname=f"Pagination Employee {i}",
-                firstname="Test",
-                extension=f"{1000+i:04d}",
-                email=f"pagination{i}@example.com",
-                officecode=office,
-                jobtitle="Test Position",
-            )
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    employeenumber=4000 + i,
+                    lastname=f"Pagination Employee {i}",
+                    firstname="Test",
+                    extension=f"{1000+i:04d}",
+                    email=f"pagination{i}@example.com",
+                    officecode=office,
+                    jobtitle="Test Position",
+                )
+                for i in range(15)  # More than default page size
+            ]
+        )
 
-        url = reverse("classicmodels:employee-list")
-        response = authenticated_api_client.get(url)
+        url = EMPLOYEE_LIST_URL
+        # A full page still costs COUNT + SELECT, with no per-employee lookups
+        with django_assert_max_num_queries(2):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert "count" in response.data
@@ -568,26 +549,30 @@ class TestEmployeeAPI:
     def test_employee_ordering(self, authenticated_api_client, office):
         """Test employee ordering."""
         # Create employees in specific order
-        Employee.objects.create(
-            employeenumber=5001,
-            lastname="Z Employee",
-            firstname="Test",
-            extension="0001",
-            email="z@example.com",
-            officecode=office,
-            jobtitle="Test",
-        )
-        Employee.objects.create(
-            employeenumber=5002,
-            lastname="A Employee",
-            firstname="Test",
-            extension="0002",
-            email="a@example.com",
-            officecode=office,
-            jobtitle="Test",
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    employeenumber=5001,
+                    lastname="Z Employee",
+                    firstname="Test",
+                    extension="0001",
+                    email="z@example.com",
+                    officecode=office,
+                    jobtitle="Test",
+                ),
+                Employee(
+                    employeenumber=5002,
+                    lastname="A Employee",
+                    firstname="Test",
+                    extension="0002",
+                    email="a@example.com",
+                    officecode=office,
+                    jobtitle="Test",
+                ),
+            ]
         )
 
-        url = reverse("classicmodels:employee-list")
+        url = EMPLOYEE_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -595,17 +580,18 @@ class TestEmployeeAPI:
         assert len(response.data["results"]) >= 2
 
     @pytest.mark.django_db
-    def test_employee_relationships(self, authenticated_api_client, employee, office):
+    def test_employee_relationships(
+        self, authenticated_api_client, shared_employee, django_assert_max_num_queries
+    ):
         """Test employee relationships in API response."""
-        url = reverse(
-            "classicmodels:employee-detail",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
-        response = authenticated_api_client.get(url)
+        url = EMPLOYEE_DETAIL_URL.format(shared_employee.employeenumber)
+        # officecode and reportsto are serialized from their FK columns
+        with django_assert_max_num_queries(1):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert "officecode" in response.data
-        assert response.data["officecode"] == office.officecode
+        assert response.data["officecode"] == shared_employee.officecode_id
 
     @pytest.mark.django_db
     def test_get_employee_reports_authenticated(
@@ -616,10 +602,7 @@ class TestEmployeeAPI:
         employee.reportsto = manager_employee
         employee.save()
 
-        url = reverse(
-            "classicmodels:employee-reports",
-            kwargs={"employeenumber": manager_employee.employeenumber},
-        )
+        url = EMPLOYEE_REPORTS_URL.format(manager_employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -637,10 +620,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_get_employee_reports_unauthenticated(self, api_client, manager_employee):
         """Test retrieving reports for a manager when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-reports",
-            kwargs={"employeenumber": manager_employee.employeenumber},
-        )
+        url = EMPLOYEE_REPORTS_URL.format(manager_employee.employeenumber)
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -648,9 +628,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_get_employee_reports_nonexistent_employee(self, authenticated_api_client):
         """Test retrieving reports for an employee that doesn't exist."""
-        url = reverse(
-            "classicmodels:employee-reports", kwargs={"employeenumber": 99999}
-        )
+        url = EMPLOYEE_REPORTS_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -660,10 +638,7 @@ class TestEmployeeAPI:
         self, authenticated_api_client, manager_employee
     ):
         """Test retrieving reports for a manager with no direct reports."""
-        url = reverse(
-            "classicmodels:employee-reports",
-            kwargs={"employeenumber": manager_employee.employeenumber},
-        )
+        url = EMPLOYEE_REPORTS_URL.format(manager_employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -695,10 +670,7 @@ class TestEmployeeAPI:
             )
             reports.append(report)
 
-        url = reverse(
-            "classicmodels:employee-reports",
-            kwargs={"employeenumber": manager_employee.employeenumber},
-        )
+        url = EMPLOYEE_REPORTS_URL.format(manager_employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -731,10 +703,7 @@ class TestEmployeeAPI:
                 jobtitle="Sales Rep",
             )
 
-        url = reverse(
-            "classicmodels:employee-reports",
-            kwargs={"employeenumber": manager_employee.employeenumber},
-        )
+        url = EMPLOYEE_REPORTS_URL.format(manager_employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -749,10 +718,7 @@ class TestEmployeeAPI:
         self, authenticated_api_client, employee, customer
     ):
         """Test retrieving customers for a sales rep when authenticated."""
-        url = reverse(
-            "classicmodels:employee-customers",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -770,10 +736,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_get_employee_customers_unauthenticated(self, api_client, employee):
         """Test retrieving customers for a sales rep when not authenticated."""
-        url = reverse(
-            "classicmodels:employee-customers",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(employee.employeenumber)
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -783,9 +746,7 @@ class TestEmployeeAPI:
         self, authenticated_api_client
     ):
         """Test retrieving customers for an employee that doesn't exist."""
-        url = reverse(
-            "classicmodels:employee-customers", kwargs={"employeenumber": 99999}
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(99999)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -793,10 +754,7 @@ class TestEmployeeAPI:
     @pytest.mark.django_db
     def test_get_employee_customers_empty(self, authenticated_api_client, employee):
         """Test retrieving customers for a sales rep with no customers."""
-        url = reverse(
-            "classicmodels:employee-customers",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -829,10 +787,7 @@ class TestEmployeeAPI:
             )
             customers.append(customer)
 
-        url = reverse(
-            "classicmodels:employee-customers",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -866,10 +821,7 @@ class TestEmployeeAPI:
                 salesrepemployeenumber=employee,
             )
 
-        url = reverse(
-            "classicmodels:employee-customers",
-            kwargs={"employeenumber": employee.employeenumber},
-        )
+        url = EMPLOYEE_CUSTOMERS_URL.format(employee.employeenumber)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -2,118 +2,156 @@
 Tests for Office API endpoints.
 """
 
+from types import MappingProxyType
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
 
-from classicmodels.models import Office
+from classicmodels.models import Employee, Office
+
+# Resolve the office URLs once; detail URLs only differ by officecode
+OFFICE_LIST_URL = reverse("classicmodels:office-list")
+OFFICE_DETAIL_URL = OFFICE_LIST_URL + "/{}"
+OFFICE_EMPLOYEES_URL = OFFICE_DETAIL_URL + "/employees"
+
+# Required office fields shared by the create/update tests; each test adds
+# the officecode and overrides whatever it is exercising.
+# Read-only so a test cannot leak changes into the next one.
+BASE_OFFICE_DATA = MappingProxyType(
+    {
+        "city": "Test City",
+        "phone": "+1-555-0000",
+        "addressline1": "123 Test Ave",
+        "country": "USA",
+        "postalcode": "12345",
+        "territory": "NA",
+    }
+)
+
+PHONE_FORMATS = (
+    "+1-555-0123",
+    "(555) 123-4567",
+    "555-123-4567",
+    "5551234567",
+    "+44 20 7946 0958",
+    "+33 1 42 86 83 26",
+)
+POSTAL_CODES = (
+    "12345",  # US ZIP
+    "12345-6789",  # US ZIP+4
+    "K1A 0A6",  # Canadian postal code
+    "SW1A 1AA",  # UK postal code
+    "75001",  # French postal code
+    "100-0001",  # Japanese postal code
+)
+TERRITORIES = ("NA", "EMEA", "APAC", "LATAM", "GLOBAL")
 
 
 class TestOfficeAPI:
     """Test cases for Office API endpoints."""
 
+    @pytest.mark.parametrize(
+        "url_template,url_name",
+        [
+            (OFFICE_DETAIL_URL, "classicmodels:office-detail"),
+            (OFFICE_EMPLOYEES_URL, "classicmodels:office-employees"),
+        ],
+    )
+    def test_office_url_templates(self, url_template, url_name):
+        """Test that the precomputed URL templates match reverse()."""
+        assert url_template.format("TEST001") == reverse(
+            url_name, kwargs={"officecode": "TEST001"}
+        )
+
     @pytest.mark.django_db
-    def test_list_offices_authenticated(self, authenticated_api_client, office):
+    def test_list_offices_authenticated(self, authenticated_api_client, shared_office):
         """Test listing offices when authenticated."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
-        assert response.data["results"][0]["officecode"] == office.officecode
+        assert response.data["results"][0]["officecode"] == shared_office.officecode
 
-    @pytest.mark.django_db
-    def test_list_offices_unauthenticated(self, api_client, office):
-        """Test listing offices when not authenticated."""
-        url = reverse("classicmodels:office-list")
-        response = api_client.get(url)
+    @pytest.mark.parametrize("method", ["get", "post"])
+    def test_office_list_unauthenticated(self, api_client, method):
+        """Test that the office list endpoint requires authentication."""
+        url = OFFICE_LIST_URL
+        response = getattr(api_client, method)(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.django_db
-    def test_retrieve_office_authenticated(self, authenticated_api_client, office):
-        """Test retrieving a specific office when authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        response = authenticated_api_client.get(url)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["officecode"] == office.officecode
-        assert response.data["city"] == office.city
-
-    @pytest.mark.django_db
-    def test_retrieve_office_unauthenticated(self, api_client, office):
-        """Test retrieving an office when not authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        response = api_client.get(url)
+    @pytest.mark.parametrize(
+        "url_template,method",
+        [
+            (OFFICE_DETAIL_URL, "get"),
+            (OFFICE_DETAIL_URL, "put"),
+            (OFFICE_DETAIL_URL, "patch"),
+            (OFFICE_DETAIL_URL, "delete"),
+            (OFFICE_EMPLOYEES_URL, "get"),
+        ],
+    )
+    def test_office_detail_unauthenticated(self, api_client, url_template, method):
+        """Test that office detail endpoints require authentication."""
+        # The 401 is raised before the office is looked up, so no row is needed
+        url = url_template.format("ANY")
+        response = getattr(api_client, method)(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     @pytest.mark.django_db
-    def test_retrieve_nonexistent_office(self, authenticated_api_client):
-        """Test retrieving an office that doesn't exist."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": "NONEXISTENT"}
-        )
+    def test_retrieve_office_authenticated(
+        self, authenticated_api_client, shared_office
+    ):
+        """Test retrieving a specific office when authenticated."""
+        url = OFFICE_DETAIL_URL.format(shared_office.officecode)
         response = authenticated_api_client.get(url)
 
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["officecode"] == shared_office.officecode
+        assert response.data["city"] == shared_office.city
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "url_template,method",
+        [
+            (OFFICE_DETAIL_URL, "get"),
+            (OFFICE_DETAIL_URL, "delete"),
+            (OFFICE_EMPLOYEES_URL, "get"),
+        ],
+    )
+    def test_nonexistent_office(self, authenticated_api_client, url_template, method):
+        """Test that office endpoints return 404 for an unknown office code."""
+        url = url_template.format("NONEXISTENT")
+        response = getattr(authenticated_api_client, method)(url)
+
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.django_db
     def test_create_office_authenticated(self, authenticated_api_client):
         """Test creating an office when authenticated."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         data = {
+            **BASE_OFFICE_DATA,
             "officecode": "NEW001",
             "city": "New City",
-            "phone": "+1-555-9999",
-            "addressline1": "999 New Street",
             "addressline2": "Suite 500",
             "state": "NY",
-            "country": "USA",
-            "postalcode": "10001",
-            "territory": "NA",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["officecode"] == "NEW001"
-        assert response.data["city"] == "New City"
-
-    @pytest.mark.django_db
-    def test_create_office_unauthenticated(self, api_client):
-        """Test creating an office when not authenticated."""
-        url = reverse("classicmodels:office-list")
-        data = {
-            "officecode": "NEW001",
-            "city": "New City",
-            "phone": "+1-555-9999",
-            "addressline1": "999 New Street",
-            "country": "USA",
-            "postalcode": "10001",
-            "territory": "NA",
-        }
-
-        response = api_client.post(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert {field: response.data[field] for field in data} == data
 
     @pytest.mark.django_db
     def test_create_office_duplicate_code(self, authenticated_api_client, office):
         """Test creating an office with duplicate office code."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         data = {
+            **BASE_OFFICE_DATA,
             "officecode": office.officecode,  # Duplicate
-            "city": "Duplicate City",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Duplicate Ave",
-            "country": "USA",
-            "postalcode": "12345",
-            "territory": "NA",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
@@ -123,229 +161,127 @@ class TestOfficeAPI:
     @pytest.mark.django_db
     def test_create_office_minimal_data(self, authenticated_api_client):
         """Test creating an office with minimal required data."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         data = {
+            **BASE_OFFICE_DATA,
             "officecode": "MIN001",
-            "city": "Minimal City",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Minimal Ave",
-            "country": "USA",
-            "postalcode": "12345",
-            "territory": "NA",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["officecode"] == "MIN001"
-        assert response.data["addressline2"] is None
-        assert response.data["state"] is None
+        expected = {**data, "addressline2": None, "state": None}
+        assert {field: response.data[field] for field in expected} == expected
 
     @pytest.mark.django_db
     def test_update_office_authenticated(self, authenticated_api_client, office):
         """Test updating an office when authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
+        url = OFFICE_DETAIL_URL.format(office.officecode)
         data = {
+            **BASE_OFFICE_DATA,
             "officecode": office.officecode,
             "city": "Updated City",
             "phone": "+1-555-8888",
-            "addressline1": "888 Updated Street",
             "addressline2": "Suite 888",
             "state": "CA",
-            "country": "USA",
-            "postalcode": "90210",
-            "territory": "NA",
         }
 
         response = authenticated_api_client.put(url, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["city"] == "Updated City"
-        assert response.data["phone"] == "+1-555-8888"
-
-    @pytest.mark.django_db
-    def test_update_office_unauthenticated(self, api_client, office):
-        """Test updating an office when not authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        data = {
-            "officecode": office.officecode,
-            "city": "Updated City",
-            "phone": "+1-555-8888",
-            "addressline1": "888 Updated Street",
-            "country": "USA",
-            "postalcode": "90210",
-            "territory": "NA",
-        }
-
-        response = api_client.put(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert {field: response.data[field] for field in data} == data
 
     @pytest.mark.django_db
     def test_partial_update_office_authenticated(
         self, authenticated_api_client, office
     ):
         """Test partially updating an office when authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
+        url = OFFICE_DETAIL_URL.format(office.officecode)
         data = {"city": "Partially Updated City", "phone": "+1-555-7777"}
 
         response = authenticated_api_client.patch(url, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["city"] == "Partially Updated City"
-        assert response.data["phone"] == "+1-555-7777"
-        # Other fields should remain unchanged
-        assert response.data["officecode"] == office.officecode
-
-    @pytest.mark.django_db
-    def test_partial_update_office_unauthenticated(self, api_client, office):
-        """Test partially updating an office when not authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        data = {"city": "Partially Updated City"}
-
-        response = api_client.patch(url, data, format="json")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        # The sent fields change; the others keep their stored values
+        expected = {**data, "officecode": office.officecode, "country": office.country}
+        assert {field: response.data[field] for field in expected} == expected
 
     @pytest.mark.django_db
     def test_delete_office_authenticated(self, authenticated_api_client, office):
         """Test deleting an office when authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
+        url = OFFICE_DETAIL_URL.format(office.officecode)
         response = authenticated_api_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Office.objects.filter(officecode=office.officecode).exists()
 
-    @pytest.mark.django_db
-    def test_delete_office_unauthenticated(self, api_client, office):
-        """Test deleting an office when not authenticated."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        response = api_client.delete(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    @pytest.mark.django_db
-    def test_delete_nonexistent_office(self, authenticated_api_client):
-        """Test deleting an office that doesn't exist."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": "NONEXISTENT"}
-        )
-        response = authenticated_api_client.delete(url)
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
     @pytest.mark.django_db
     def test_office_serializer_validation(self, authenticated_api_client):
         """Test office serializer validation."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
 
         # Test with invalid data (exceeds max length)
         data = {
+            **BASE_OFFICE_DATA,
             "officecode": "x" * 11,  # Exceeds max_length=10
-            "city": "Valid City",
-            "phone": "+1-555-0000",
-            "addressline1": "123 Valid Ave",
-            "country": "USA",
-            "postalcode": "12345",
-            "territory": "NA",
         }
 
         response = authenticated_api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @pytest.mark.django_db
-    def test_office_phone_formats(self, authenticated_api_client):
+    @pytest.mark.parametrize("i,phone", list(enumerate(PHONE_FORMATS)))
+    def test_office_phone_formats(self, authenticated_api_client, i, phone):
         """Test various phone number formats."""
-        url = reverse("classicmodels:office-list")
-        phone_formats = [
-            "+1-555-0123",
-            "(555) 123-4567",
-            "555-123-4567",
-            "5551234567",
-            "+44 20 7946 0958",
-            "+33 1 42 86 83 26",
-        ]
-
-        for i, phone in enumerate(phone_formats):
-            data = {
-                "officecode": f"PHONE{i:03d}",
-                "city": f"Phone City {i}",
-                "phone": phone,
-                "addressline1": f"{100+i} Phone Ave",
-                "country": "USA",
-                "postalcode": f"{10000+i}",
-                "territory": "NA",
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["phone"] == phone
+        url = OFFICE_LIST_URL
+        data = {
+            **BASE_OFFICE_DATA,
+            "officecode": f"PHONE{i:03d}",
+            "phone": phone,
+        }
+
+        response = authenticated_api_client.post(url, data, format="json")
+
+        # Show the validation errors if the value is rejected
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        assert response.data["phone"] == phone
 
     @pytest.mark.django_db
-    def test_office_postal_code_formats(self, authenticated_api_client):
+    @pytest.mark.parametrize("i,postal_code", list(enumerate(POSTAL_CODES)))
+    def test_office_postal_code_formats(self, authenticated_api_client, i, postal_code):
         """Test various postal code formats."""
-        url = reverse("classicmodels:office-list")
-        postal_codes = [
-            "12345",  # US ZIP
-            "12345-6789",  # US ZIP+4
-            "K1A 0A6",  # Canadian postal code
-            "SW1A 1AA",  # UK postal code
-            "75001",  # French postal code
-            "100-0001",  # Japanese postal code
-        ]
-
-        for i, postal_code in enumerate(postal_codes):
-            data = {
-                "officecode": f"POST{i:03d}",
-                "city": f"Postal City {i}",
-                "phone": "+1-555-0000",
-                "addressline1": f"{100+i} Postal Ave",
-                "country": "USA",
-                "postalcode": postal_code,
-                "territory": "NA",
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["postalcode"] == postal_code
+        url = OFFICE_LIST_URL
+        data = {
+            **BASE_OFFICE_DATA,
+            "officecode": f"POST{i:03d}",
+            "postalcode": postal_code,
+        }
+
+        response = authenticated_api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        assert response.data["postalcode"] == postal_code
 
     @pytest.mark.django_db
-    def test_office_territory_values(self, authenticated_api_client):
+    @pytest.mark.parametrize("i,territory", list(enumerate(TERRITORIES)))
+    def test_office_territory_values(self, authenticated_api_client, i, territory):
         """Test various territory values."""
-        url = reverse("classicmodels:office-list")
-        territories = ["NA", "EMEA", "APAC", "LATAM", "GLOBAL"]
-
-        for i, territory in enumerate(territories):
-            data = {
-                "officecode": f"TERR{i:03d}",
-                "city": f"Territory City {i}",
-                "phone": "+1-555-0000",
-                "addressline1": f"{100+i} Territory Ave",
-                "country": "USA",
-                "postalcode": "12345",
-                "territory": territory,
-            }
-
-            response = authenticated_api_client.post(url, data, format="json")
-            assert response.status_code == status.HTTP_201_CREATED
-            assert response.data["territory"] == territory
+        url = OFFICE_LIST_URL
+        data = {
+            **BASE_OFFICE_DATA,
+            "officecode": f"TERR{i:03d}",
+            "territory": territory,
+        }
+
+        response = authenticated_api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        assert response.data["territory"] == territory
 
     @pytest.mark.django_db
     def test_office_unicode_handling(self, authenticated_api_client):
         """Test handling of unicode characters in office."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         data = {
             "officecode": "UNICODE001",
             "city": "Cité émojis 🏢",
@@ -361,26 +297,20 @@ class TestOfficeAPI:
         response = authenticated_api_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert "émojis" in response.data["city"]
-        assert "🏢" in response.data["city"]
-        assert "émojis" in response.data["addressline1"]
-        assert "🏠" in response.data["addressline1"]
+        # Every field must round-trip exactly, not just keep the emoji
+        assert {field: response.data[field] for field in data} == data
 
     @pytest.mark.django_db
     def test_office_address_combinations(self, authenticated_api_client):
         """Test various address line combinations."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
 
         # Test with both address lines
         data1 = {
+            **BASE_OFFICE_DATA,
             "officecode": "ADDR001",
-            "city": "Both Lines City",
-            "phone": "+1-555-0000",
             "addressline1": "123 Main Street",
             "addressline2": "Suite 500",
-            "country": "USA",
-            "postalcode": "12345",
-            "territory": "NA",
         }
 
         response1 = authenticated_api_client.post(url, data1, format="json")
@@ -390,13 +320,9 @@ class TestOfficeAPI:
 
         # Test with only address line 1
         data2 = {
+            **BASE_OFFICE_DATA,
             "officecode": "ADDR002",
-            "city": "One Line City",
-            "phone": "+1-555-0000",
             "addressline1": "456 Single Ave",
-            "country": "USA",
-            "postalcode": "54321",
-            "territory": "NA",
         }
 
         response2 = authenticated_api_client.post(url, data2, format="json")
@@ -407,18 +333,13 @@ class TestOfficeAPI:
     @pytest.mark.django_db
     def test_office_state_combinations(self, authenticated_api_client):
         """Test various state field combinations."""
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
 
         # Test with state
         data1 = {
+            **BASE_OFFICE_DATA,
             "officecode": "STATE001",
-            "city": "State City",
-            "phone": "+1-555-0000",
-            "addressline1": "123 State Ave",
             "state": "CA",
-            "country": "USA",
-            "postalcode": "12345",
-            "territory": "NA",
         }
 
         response1 = authenticated_api_client.post(url, data1, format="json")
@@ -427,13 +348,10 @@ class TestOfficeAPI:
 
         # Test without state
         data2 = {
+            **BASE_OFFICE_DATA,
             "officecode": "STATE002",
-            "city": "No State City",
-            "phone": "+1-555-0000",
-            "addressline1": "456 No State Ave",
             "country": "Canada",
             "postalcode": "K1A 0A6",
-            "territory": "NA",
         }
 
         response2 = authenticated_api_client.post(url, data2, format="json")
@@ -444,18 +362,22 @@ class TestOfficeAPI:
     def test_office_pagination(self, authenticated_api_client, multiple_offices):
         """Test office pagination."""
         # Create additional offices beyond the existing ones
-        for i in range(15):  # More than default page size
-            Office.objects.create(
-                officecode=f"PAGE{i:03d}",
-                city=f"Pagination City {i}",
-                phone=f"+1-555-{1000+i:04d}",
-                addressline1=f"{100+i} Pagination Ave",
-                country="USA",
-                postalcode=f"{10000+i}",
-                territory="NA",
-            )
+        Office.objects.bulk_create(
+            [
+                Office(
+                    officecode=f"PAGE{i:03d}",
+                    city=f"Pagination City {i}",
+                    phone=f"+1-555-{1000+i:04d}",
+                    addressline1=f"{100+i} Pagination Ave",
+                    country="USA",
+                    postalcode=f"{10000+i}",
+                    territory="NA",
+                )
+                for i in range(15)  # More than default page size
+            ]
+        )
 
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -468,26 +390,30 @@ class TestOfficeAPI:
     def test_office_ordering(self, authenticated_api_client):
         """Test office ordering."""
         # Create offices in specific order
-        Office.objects.create(
-            officecode="ZOFF001",
-            city="Z Office City",
-            phone="+1-555-0000",
-            addressline1="123 Z Ave",
-            country="USA",
-            postalcode="12345",
-            territory="NA",
-        )
-        Office.objects.create(
-            officecode="AOFF001",
-            city="A Office City",
-            phone="+1-555-0000",
-            addressline1="123 A Ave",
-            country="USA",
-            postalcode="12345",
-            territory="NA",
+        Office.objects.bulk_create(
+            [
+                Office(
+                    officecode="ZOFF001",
+                    city="Z Office City",
+                    phone="+1-555-0000",
+                    addressline1="123 Z Ave",
+                    country="USA",
+                    postalcode="12345",
+                    territory="NA",
+                ),
+                Office(
+                    officecode="AOFF001",
+                    city="A Office City",
+                    phone="+1-555-0000",
+                    addressline1="123 A Ave",
+                    country="USA",
+                    postalcode="12345",
+                    territory="NA",
+                ),
+            ]
         )
 
-        url = reverse("classicmodels:office-list")
+        url = OFFICE_LIST_URL
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -495,12 +421,14 @@ class TestOfficeAPI:
         assert len(response.data["results"]) >= 2
 
     @pytest.mark.django_db
-    def test_office_relationships(self, authenticated_api_client, office, employee):
+    def test_office_relationships(
+        self, authenticated_api_client, shared_employee, django_assert_num_queries
+    ):
         """Test office relationships in API response."""
-        url = reverse(
-            "classicmodels:office-detail", kwargs={"officecode": office.officecode}
-        )
-        response = authenticated_api_client.get(url)
+        url = OFFICE_DETAIL_URL.format(shared_employee.officecode_id)
+        # A single office SELECT; the serializer does not walk the employees
+        with django_assert_num_queries(1):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Note: Employee relationships might not be included in the response
@@ -508,13 +436,10 @@ class TestOfficeAPI:
 
     @pytest.mark.django_db
     def test_get_office_employees_authenticated(
-        self, authenticated_api_client, office, employee
+        self, authenticated_api_client, shared_employee
     ):
         """Test retrieving employees for an office when authenticated."""
-        url = reverse(
-            "classicmodels:office-employees",
-            kwargs={"officecode": office.officecode},
-        )
+        url = OFFICE_EMPLOYEES_URL.format(shared_employee.officecode_id)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -523,38 +448,16 @@ class TestOfficeAPI:
         if "results" in response.data:
             assert len(response.data["results"]) >= 1
             assert (
-                response.data["results"][0]["employeenumber"] == employee.employeenumber
+                response.data["results"][0]["employeenumber"]
+                == shared_employee.employeenumber
             )
         else:
             assert len(response.data) >= 1
-            assert response.data[0]["employeenumber"] == employee.employeenumber
-
-    @pytest.mark.django_db
-    def test_get_office_employees_unauthenticated(self, api_client, office):
-        """Test retrieving employees for an office when not authenticated."""
-        url = reverse(
-            "classicmodels:office-employees",
-            kwargs={"officecode": office.officecode},
-        )
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    @pytest.mark.django_db
-    def test_get_office_employees_nonexistent_office(self, authenticated_api_client):
-        """Test retrieving employees for an office that doesn't exist."""
-        url = reverse(
-            "classicmodels:office-employees", kwargs={"officecode": "NONEXIST"}
-        )
-        response = authenticated_api_client.get(url)
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+            assert response.data[0]["employeenumber"] == shared_employee.employeenumber
 
     @pytest.mark.django_db
     def test_get_office_employees_empty(self, authenticated_api_client):
         """Test retrieving employees for an office with no employees."""
-        from classicmodels.models import Office
-
         # Create an office with no employees
         office_no_employees = Office.objects.create(
             officecode="EMPTY01",
@@ -566,10 +469,7 @@ class TestOfficeAPI:
             territory="NA",
         )
 
-        url = reverse(
-            "classicmodels:office-employees",
-            kwargs={"officecode": office_no_employees.officecode},
-        )
+        url = OFFICE_EMPLOYEES_URL.format(office_no_employees.officecode)
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -581,30 +481,29 @@ class TestOfficeAPI:
 
     @pytest.mark.django_db
     def test_get_office_employees_multiple_employees(
-        self, authenticated_api_client, office
+        self, authenticated_api_client, office, django_assert_num_queries
     ):
         """Test retrieving employees for an office with multiple employees."""
-        from classicmodels.models import Employee
-
         # Create multiple employees in this office
-        employees = []
-        for i in range(3):
-            employee = Employee.objects.create(
-                employeenumber=2000 + i,
-                lastname=f"Employee{i+1}",
-                firstname="Test",
-                extension=f"EXT{i+1}",
-                email=f"employee{i+1}@example.com",
-                officecode=office,
-                jobtitle="Sales Rep",
-            )
-            employees.append(employee)
-
-        url = reverse(
-            "classicmodels:office-employees",
-            kwargs={"officecode": office.officecode},
+        employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    employeenumber=2000 + i,
+                    lastname=f"Employee{i+1}",
+                    firstname="Test",
+                    extension=f"EXT{i+1}",
+                    email=f"employee{i+1}@example.com",
+                    officecode=office,
+                    jobtitle="Sales Rep",
+                )
+                for i in range(3)
+            ]
         )
-        response = authenticated_api_client.get(url)
+
+        url = OFFICE_EMPLOYEES_URL.format(office.officecode)
+        # Office lookup + COUNT + page
+        with django_assert_num_queries(3):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Check that all employees are returned
@@ -617,27 +516,30 @@ class TestOfficeAPI:
             assert employee.employeenumber in employee_numbers
 
     @pytest.mark.django_db
-    def test_get_office_employees_pagination(self, authenticated_api_client, office):
+    def test_get_office_employees_pagination(
+        self, authenticated_api_client, office, django_assert_num_queries
+    ):
         """Test pagination for office employees endpoint."""
-        from classicmodels.models import Employee
-
         # Create more employees than default page size
-        for i in range(15):
-            Employee.objects.create(
-                employeenumber=3000 + i,
-                lastname=f"Pagination{i+1}",
-                firstname="Test",
-                extension=f"PAGE{i+1}",
-                email=f"pagination{i+1}@example.com",
-                officecode=office,
-                jobtitle="Sales Rep",
-            )
-
-        url = reverse(
-            "classicmodels:office-employees",
-            kwargs={"officecode": office.officecode},
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    employeenumber=3000 + i,
+                    lastname=f"Pagination{i+1}",
+                    firstname="Test",
+                    extension=f"PAGE{i+1}",
+                    email=f"pagination{i+1}@example.com",
+                    officecode=office,
+                    jobtitle="Sales Rep",
+                )
+                for i in range(15)
+            ]
         )
-        response = authenticated_api_client.get(url)
+
+        url = OFFICE_EMPLOYEES_URL.format(office.officecode)
+        # Office lookup + COUNT + one SELECT for the page, however many rows
+        with django_assert_num_queries(3):
+            response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Should have pagination metadata
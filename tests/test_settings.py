@@ -91,6 +91,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Use a fast (insecure) password hasher; PBKDF2 dominates user creation and
+# login time otherwise
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -137,7 +143,7 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
-    "UPDATE_LAST_LOGIN": False,
+    "UPDATE_LAST_LOGIN": False,  # Keep token issue from writing last_login
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "VERIFYING_KEY": None,
@@ -281,11 +287,6 @@ if "test" in os.environ.get("DJANGO_SETTINGS_MODULE", ""):
     # Disable migrations for tests
     MIGRATION_MODULES = DisableMigrations()
 
-    # Use faster password hashing for tests
-    PASSWORD_HASHERS = [
-        "django.contrib.auth.hashers.MD5PasswordHasher",
-    ]
-
     # Disable logging during tests
     handlers = LOGGING.get("handlers", {})
     if handlers and hasattr(handlers, "__contains__") and "console" in handlers:
@@ -28,7 +28,10 @@ class TestDataFactory:
 
     @staticmethod
     def create_user(
-        username="testuser", email="test@example.com", password="testpass123", **kwargs
+        username="factoryuser",
+        email="test@example.com",
+        password="testpass123",
+        **kwargs,
     ):
         """Create a test user."""
         return User.objects.create_user(